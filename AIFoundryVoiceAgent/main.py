@@ -7,14 +7,14 @@ import os
 import sys
 import asyncio
 import json
-import base64
+import binascii
+from collections import deque
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass
 import logging
-import queue
 import signal
-from typing import Union, Optional, Dict, Any, TYPE_CHECKING
+from typing import Union, Optional, Dict, Any, Awaitable, Callable, TYPE_CHECKING
 
 from azure.core.credentials import AzureKeyCredential
 from azure.core.credentials_async import AsyncTokenCredential
@@ -41,6 +41,11 @@ from azure.ai.voicelive.models import (
 from dotenv import load_dotenv
 import pyaudio
 
+try:
+    import pybase64  # optional SIMD base64: pip install pybase64
+except ImportError:
+    pybase64 = None
+
 if TYPE_CHECKING:
     from azure.ai.voicelive.aio import VoiceLiveConnection
 
@@ -91,15 +96,51 @@ class PendingQuery:
 # ============================================================
 
 
+# Capture callback result, built once instead of per 50 ms chunk
+_CONTINUE = (None, pyaudio.paContinue)
+
+if pybase64 is not None:
+    _b64encode_str = pybase64.b64encode_as_string
+else:
+    def _b64encode_str(data: bytes) -> str:
+        return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+# AUDIO_LATENCY_MS bounds: shorter buffers underrun, longer ones delay barge-in
+_AUDIO_LATENCY_MS_DEFAULT = 50
+_AUDIO_LATENCY_MS_MIN = 10
+_AUDIO_LATENCY_MS_MAX = 200
+
+
+def _audio_latency_ms() -> int:
+    """AUDIO_LATENCY_MS clamped to 10-200ms; the 50ms default if it is not an integer."""
+    raw = os.getenv("AUDIO_LATENCY_MS")
+    if raw is None:
+        return _AUDIO_LATENCY_MS_DEFAULT
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(
+            "Invalid AUDIO_LATENCY_MS=%r, using %sms", raw, _AUDIO_LATENCY_MS_DEFAULT
+        )
+        return _AUDIO_LATENCY_MS_DEFAULT
+    clamped = min(max(value, _AUDIO_LATENCY_MS_MIN), _AUDIO_LATENCY_MS_MAX)
+    if clamped != value:
+        logger.warning("AUDIO_LATENCY_MS=%s out of range, using %sms", value, clamped)
+    return clamped
+
+
 class AudioProcessor:
     """Handles real-time audio capture and playback."""
 
     loop: asyncio.AbstractEventLoop
 
-    class AudioPlaybackPacket:
-        def __init__(self, seq_num: int, data: Optional[bytes]):
-            self.seq_num = seq_num
-            self.data = data
+    # Captured audio sent per append: one WebSocket frame and one loop wakeup
+    # per batch instead of per chunk, well under the VAD silence window
+    CAPTURE_BATCH_MS = 200
+    # Captured audio kept while the sender is stalled; older chunks are dropped
+    # so a slow connection cannot grow the backlog or replay stale speech
+    MAX_CAPTURE_BACKLOG_MS = 5000
 
     def __init__(self, connection):
         self.connection = connection
@@ -107,66 +148,118 @@ class AudioProcessor:
         self.format = pyaudio.paInt16
         self.channels = 1
         self.rate = 24000
-        self.chunk_size = 1200
+        # Frames per PortAudio buffer (50ms by default); lower AUDIO_LATENCY_MS
+        # for snappier barge-in at the cost of more audio callbacks per second
+        latency_ms = _audio_latency_ms()
+        self.chunk_size = self.rate * latency_ms // 1000
+        # Chunks per append and chunks kept in the backlog at this latency
+        self._capture_batch = max(1, self.CAPTURE_BATCH_MS // latency_ms)
         self.input_stream = None
-        self.playback_queue: queue.Queue[AudioProcessor.AudioPlaybackPacket] = (
-            queue.Queue()
-        )
-        self.playback_base = 0
-        self.next_seq_num = 0
+        self._capture_chunks: deque[Optional[bytes]] = deque(
+            maxlen=self.MAX_CAPTURE_BACKLOG_MS // latency_ms
+        )  # None stops the sender
+        self._capture_ready = asyncio.Event()
+        self._capture_wakeup_pending = False
+        self._capture_task: Optional[asyncio.Task] = None
+        # Raw PCM chunks for playback (None ends the stream). deque append/popleft
+        # are thread-safe, so no per-chunk packet object or queue lock is needed.
+        self.playback_queue: deque[Optional[bytes]] = deque()
+        # Bumped by skip_pending_audio so the callback drops its partial chunk
+        self._skip_epoch = 0
         self.output_stream: Optional[pyaudio.Stream] = None
 
-    def start_capture(self):
-        def _capture_callback(in_data, _frame_count, _time_info, _status_flags):
-            audio_base64 = base64.b64encode(in_data).decode("utf-8")
-            asyncio.run_coroutine_threadsafe(
-                self.connection.input_audio_buffer.append(audio=audio_base64), self.loop
-            )
-            return (None, pyaudio.paContinue)
+    def _capture_callback(self, in_data, _frame_count, _time_info, _status_flags):
+        # Only hand the raw chunk over; encoding and sending happen on the loop
+        chunks = self._capture_chunks
+        chunks.append(in_data)
+        if not self._capture_wakeup_pending and len(chunks) >= self._capture_batch:
+            self._capture_wakeup_pending = True
+            self.loop.call_soon_threadsafe(self._capture_ready.set)
+        return _CONTINUE
 
+    def start_capture(self):
         if self.input_stream:
             return
-        self.loop = asyncio.get_event_loop()
+        self.loop = asyncio.get_running_loop()
+        self._capture_task = self.loop.create_task(self._send_captured_audio())
         self.input_stream = self.audio.open(
             format=self.format,
             channels=self.channels,
             rate=self.rate,
             input=True,
             frames_per_buffer=self.chunk_size,
-            stream_callback=_capture_callback,
+            stream_callback=self._capture_callback,
         )
 
+    async def _send_captured_audio(self):
+        """Base64-encode captured chunks in bulk and append them to the input buffer."""
+        chunks = self._capture_chunks
+        batch = self._capture_batch
+        try:
+            while True:
+                await self._capture_ready.wait()
+                self._capture_ready.clear()
+                self._capture_wakeup_pending = False
+                while chunks:
+                    if chunks[0] is None:  # end-of-capture sentinel from shutdown
+                        return
+                    if len(chunks) < batch:
+                        break  # the rest goes out with the next full batch
+                    data = b"".join([chunks.popleft() for _ in range(batch)])
+                    await self.connection.input_audio_buffer.append(audio=_b64encode_str(data))
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Error sending captured audio")
+
     def start_playback(self):
         if self.output_stream:
             return
-        remaining = bytes()
+        # Reused per stream: the callback fills out_buf in place via memoryview
+        # slices instead of concatenating bytes on the audio thread
+        sample_width = pyaudio.get_sample_size(self.format)
+        popleft = self.playback_queue.popleft  # the deque is only ever cleared, never replaced
+        out_buf = bytearray(self.chunk_size * sample_width)
+        out = memoryview(out_buf)
+        silence = bytes(len(out_buf))
+        remaining = memoryview(b"")
+        seen_epoch = self._skip_epoch
 
         def _playback_callback(_in_data, frame_count, _time_info, _status_flags):
-            nonlocal remaining
-            frame_count *= pyaudio.get_sample_size(pyaudio.paInt16)
-            out = remaining[:frame_count]
-            remaining = remaining[frame_count:]
-
-            while len(out) < frame_count:
+            nonlocal out_buf, out, silence, remaining, seen_epoch
+            frame_count *= sample_width
+            if frame_count > len(out_buf):
+                out_buf = bytearray(frame_count)
+                out = memoryview(out_buf)
+                silence = bytes(frame_count)
+
+            if self._skip_epoch != seen_epoch:
+                seen_epoch = self._skip_epoch
+                remaining = memoryview(b"")
+
+            n = min(len(remaining), frame_count)
+            out[:n] = remaining[:n]
+            remaining = remaining[n:]
+
+            while n < frame_count:
                 try:
-                    packet = self.playback_queue.get_nowait()
-                except queue.Empty:
-                    out = out + bytes(frame_count - len(out))
+                    chunk = popleft()
+                except IndexError:
+                    out[n:frame_count] = silence[: frame_count - n]
+                    n = frame_count
                     continue
-                if not packet or not packet.data:
+                if not chunk:
                     break
-                if packet.seq_num < self.playback_base:
-                    if len(remaining) > 0:
-                        remaining = bytes()
-                    continue
-                num_to_take = frame_count - len(out)
-                out = out + packet.data[:num_to_take]
-                remaining = packet.data[num_to_take:]
+                data = memoryview(chunk)
+                num_to_take = min(len(data), frame_count - n)
+                out[n : n + num_to_take] = data[:num_to_take]
+                remaining = data[num_to_take:]
+                n += num_to_take
 
             return (
-                (out, pyaudio.paContinue)
-                if len(out) >= frame_count
-                else (out, pyaudio.paComplete)
+                (bytes(out[:n]), pyaudio.paContinue)
+                if n >= frame_count
+                else (bytes(out[:n]), pyaudio.paComplete)
             )
 
         self.output_stream = self.audio.open(
@@ -178,27 +271,27 @@ class AudioProcessor:
             stream_callback=_playback_callback,
         )
 
-    def _get_and_increase_seq_num(self):
-        seq = self.next_seq_num
-        self.next_seq_num += 1
-        return seq
-
     def queue_audio(self, audio_data: Optional[bytes]) -> None:
-        self.playback_queue.put(
-            AudioProcessor.AudioPlaybackPacket(
-                seq_num=self._get_and_increase_seq_num(), data=audio_data
-            )
-        )
+        self.playback_queue.append(audio_data)
 
     def skip_pending_audio(self):
         """Stops current audio playback immediately."""
-        self.playback_base = self._get_and_increase_seq_num()
+        self._skip_epoch += 1
+        self.playback_queue.clear()
 
-    def shutdown(self):
+    async def shutdown(self):
         if self.input_stream:
             self.input_stream.stop_stream()
             self.input_stream.close()
             self.input_stream = None
+        if self._capture_task:
+            # The stream is closed, so no more chunks can arrive: drop the
+            # unsent ones and wait for the sender to see the sentinel and exit
+            self._capture_chunks.clear()
+            self._capture_chunks.append(None)
+            self._capture_ready.set()
+            await self._capture_task
+            self._capture_task = None
         if self.output_stream:
             self.skip_pending_audio()
             self.queue_audio(None)
@@ -214,6 +307,23 @@ class AudioProcessor:
 # ============================================================
 
 
+# Constant "still searching" tool output, serialized once
+IMMEDIATE_ACK_JSON = json.dumps(
+    {
+        "status": "searching",
+        "message": "Ich suche das gerade fuer Sie. Einen kleinen Moment bitte.",
+    }
+)
+
+# Tool output when too many background queries are already running
+QUERIES_BUSY_JSON = json.dumps(
+    {
+        "status": "busy",
+        "message": "Es laufen gerade zu viele Abfragen. Bitte fragen Sie gleich noch einmal.",
+    }
+)
+
+
 class AsyncAgentVoiceAssistant:
     """
     Voice Assistant with asynchronous agent pattern:
@@ -226,6 +336,9 @@ class AsyncAgentVoiceAssistant:
     6. WHEN DONE: Interrupt audio, inject result
     """
 
+    # Upper bound on running background queries; further calls are rejected
+    MAX_PENDING_QUERIES = 32
+
     def __init__(
         self,
         endpoint: str,
@@ -237,6 +350,10 @@ class AsyncAgentVoiceAssistant:
         self.credential = credential
         self.model = model
         self.voice = voice
+        # Resolved once instead of on every _setup_session call
+        self._voice_config: Union[AzureStandardVoice, str] = (
+            AzureStandardVoice(name=voice) if "-" in voice else voice
+        )
 
         self.instructions = """Du bist ein freundlicher Kundenservice-Assistent fuer einen Online-Shop.
 
@@ -258,10 +375,28 @@ Antworte immer auf Deutsch. Sei freundlich und natuerlich."""
         # Pending function calls
         self._pending_function_call: Optional[Dict[str, Any]] = None
 
-        # Background queries
+        # Background queries (bounded, see MAX_PENDING_QUERIES)
         self.pending_queries: Dict[str, PendingQuery] = {}
+        # Finished queries are pushed here; the checker awaits it instead of polling
+        self._completed_queries: asyncio.Queue[PendingQuery] = asyncio.Queue()
         self._result_checker_task: Optional[asyncio.Task] = None
 
+        # Event type -> handler, built once so each event costs one dict lookup
+        self._event_handlers: Dict[ServerEventType, Callable[[Any], Awaitable[None]]] = {
+            ServerEventType.SESSION_UPDATED: self._on_session_updated,
+            ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED: self._on_speech_started,
+            ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED: self._on_speech_stopped,
+            ServerEventType.RESPONSE_CREATED: self._on_response_created,
+            ServerEventType.RESPONSE_AUDIO_DELTA: self._on_audio_delta,
+            ServerEventType.RESPONSE_AUDIO_DONE: self._on_audio_done,
+            ServerEventType.RESPONSE_DONE: self._on_response_done,
+            ServerEventType.CONVERSATION_ITEM_CREATED: self._on_item_created,
+            ServerEventType.RESPONSE_FUNCTION_CALL_ARGUMENTS_DONE: (
+                self._on_function_call_arguments_done
+            ),
+            ServerEventType.ERROR: self._on_error,
+        }
+
     async def start(self):
         """Starts the Voice Assistant."""
         try:
@@ -295,15 +430,11 @@ Antworte immer auf Deutsch. Sei freundlich und natuerlich."""
             if self._result_checker_task:
                 self._result_checker_task.cancel()
             if self.audio_processor:
-                self.audio_processor.shutdown()
+                await self.audio_processor.shutdown()
 
     async def _setup_session(self):
         """Configures the session with tools."""
 
-        voice_config = (
-            AzureStandardVoice(name=self.voice) if "-" in self.voice else self.voice
-        )
-
         tools: list[Tool] = [
             FunctionTool(
                 name="lookup_order_history",
@@ -338,7 +469,7 @@ Antworte immer auf Deutsch. Sei freundlich und natuerlich."""
         session_config = RequestSession(
             modalities=[Modality.TEXT, Modality.AUDIO],
             instructions=self.instructions,
-            voice=voice_config,
+            voice=self._voice_config,
             input_audio_format=InputAudioFormat.PCM16,
             output_audio_format=OutputAudioFormat.PCM16,
             turn_detection=ServerVad(
@@ -362,68 +493,71 @@ Antworte immer auf Deutsch. Sei freundlich und natuerlich."""
             await self._handle_event(event)
 
     async def _handle_event(self, event):
-        """Event handler with function call support."""
-        ap = self.audio_processor
-        conn = self.connection
+        """Event handler with function call support: one dict lookup per event."""
+        handler = self._event_handlers.get(event.type)
+        if handler is not None:
+            await handler(event)
+
+    async def _on_session_updated(self, event):
+        logger.info("Session ready")
+        self.session_ready = True
+        self.audio_processor.start_capture()
+
+    async def _on_speech_started(self, event):
+        print("[Listening...]")
+        self.audio_processor.skip_pending_audio()
+
+        if self._active_response and not self._response_api_done:
+            try:
+                await self.connection.response.cancel()
+            except Exception:
+                pass
+
+    async def _on_speech_stopped(self, event):
+        print("[Processing...]")
+
+    async def _on_response_created(self, event):
+        self._active_response = True
+        self._response_api_done = False
 
-        if event.type == ServerEventType.SESSION_UPDATED:
-            logger.info("Session ready")
-            self.session_ready = True
-            ap.start_capture()
+    async def _on_audio_delta(self, event):
+        self.audio_processor.queue_audio(event.delta)
 
-        elif event.type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED:
-            print("[Listening...]")
-            ap.skip_pending_audio()
+    async def _on_audio_done(self, event):
+        print("[Ready...]")
 
-            if self._active_response and not self._response_api_done:
-                try:
-                    await conn.response.cancel()
-                except Exception:
-                    pass
+    async def _on_response_done(self, event):
+        self._active_response = False
+        self._response_api_done = True
+
+        if (
+            self._pending_function_call
+            and "arguments" in self._pending_function_call
+        ):
+            await self._handle_function_call(self._pending_function_call)
+            self._pending_function_call = None
+
+    async def _on_item_created(self, event):
+        item = event.item
+        if item.type == ItemType.FUNCTION_CALL:
+            self._pending_function_call = {
+                "name": item.name,
+                "call_id": item.call_id,
+                "previous_item_id": item.id,
+            }
+            print(f"[Tool detected: {item.name}]")
 
-        elif event.type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED:
-            print("[Processing...]")
-
-        elif event.type == ServerEventType.RESPONSE_CREATED:
-            self._active_response = True
-            self._response_api_done = False
-
-        elif event.type == ServerEventType.RESPONSE_AUDIO_DELTA:
-            ap.queue_audio(event.delta)
-
-        elif event.type == ServerEventType.RESPONSE_AUDIO_DONE:
-            print("[Ready...]")
-
-        elif event.type == ServerEventType.RESPONSE_DONE:
-            self._active_response = False
-            self._response_api_done = True
-
-            if (
-                self._pending_function_call
-                and "arguments" in self._pending_function_call
-            ):
-                await self._handle_function_call(self._pending_function_call)
-                self._pending_function_call = None
-
-        elif event.type == ServerEventType.CONVERSATION_ITEM_CREATED:
-            if event.item.type == ItemType.FUNCTION_CALL:
-                self._pending_function_call = {
-                    "name": event.item.name,
-                    "call_id": event.item.call_id,
-                    "previous_item_id": event.item.id,
-                }
-                print(f"[Tool detected: {event.item.name}]")
-
-        elif event.type == ServerEventType.RESPONSE_FUNCTION_CALL_ARGUMENTS_DONE:
-            if (
-                self._pending_function_call
-                and event.call_id == self._pending_function_call["call_id"]
-            ):
-                self._pending_function_call["arguments"] = event.arguments
-
-        elif event.type == ServerEventType.ERROR:
-            if "no active response" not in event.error.message.lower():
-                logger.error(f"Error: {event.error.message}")
+    async def _on_function_call_arguments_done(self, event):
+        if (
+            self._pending_function_call
+            and event.call_id == self._pending_function_call["call_id"]
+        ):
+            self._pending_function_call["arguments"] = event.arguments
+
+    async def _on_error(self, event):
+        message = event.error.message
+        if "no active response" not in message.lower():
+            logger.error(f"Error: {message}")
 
     # ================================================================
     # FUNCTION CALL HANDLING WITH ASYNC PATTERN
@@ -441,18 +575,19 @@ Antworte immer auf Deutsch. Sei freundlich und natuerlich."""
         arguments = function_call_info["arguments"]
 
         logger.info(f"Function Call: {function_name}({arguments})")
-        print(f"[Starting background query: {function_name}]")
+
+        # Reject rather than evict: every running query still gets its result
+        busy = len(self.pending_queries) >= self.MAX_PENDING_QUERIES
+        if busy:
+            logger.warning("Too many background queries, rejecting %s", function_name)
+        else:
+            print(f"[Starting background query: {function_name}]")
 
         # ========================================
         # 1. IMMEDIATE RESPONSE TO VOICELIVE
         # ========================================
-        immediate_response = {
-            "status": "searching",
-            "message": "Ich suche das gerade fuer Sie. Einen kleinen Moment bitte.",
-        }
-
         function_output = FunctionCallOutputItem(
-            call_id=call_id, output=json.dumps(immediate_response)
+            call_id=call_id, output=QUERIES_BUSY_JSON if busy else IMMEDIATE_ACK_JSON
         )
 
         await self.connection.conversation.item.create(
@@ -461,6 +596,8 @@ Antworte immer auf Deutsch. Sei freundlich und natuerlich."""
 
         # VoiceLive will now respond with smalltalk
         await self.connection.response.create()
+        if busy:
+            return
 
         # ========================================
         # 2. START BACKGROUND TASK
@@ -511,17 +648,15 @@ Antworte immer auf Deutsch. Sei freundlich und natuerlich."""
                 "die ist noch unterwegs."
             )
 
-            self.pending_queries[query_id].result = result_text
-            self.pending_queries[query_id].state = QueryState.COMPLETED
+            self._complete_query(query_id, result_text)
 
             logger.info(f"[{query_id}] Query completed")
 
         except Exception:
             logger.exception(f"[{query_id}] Error during query")
-            self.pending_queries[query_id].result = (
-                "Es tut mir leid, bei der Abfrage ist ein Fehler aufgetreten."
+            self._complete_query(
+                query_id, "Es tut mir leid, bei der Abfrage ist ein Fehler aufgetreten."
             )
-            self.pending_queries[query_id].state = QueryState.COMPLETED
 
     async def _execute_product_search(self, query_id: str, arguments: str):
         """Simulates a product search."""
@@ -533,50 +668,56 @@ Antworte immer auf Deutsch. Sei freundlich und natuerlich."""
 
             result_text = f"Ich habe 3 Produkte zu '{search_term}' gefunden: ..."
 
-            self.pending_queries[query_id].result = result_text
-            self.pending_queries[query_id].state = QueryState.COMPLETED
+            self._complete_query(query_id, result_text)
 
         except Exception:
-            self.pending_queries[query_id].result = (
-                "Die Produktsuche ist leider fehlgeschlagen."
+            self._complete_query(
+                query_id, "Die Produktsuche ist leider fehlgeschlagen."
             )
-            self.pending_queries[query_id].state = QueryState.COMPLETED
 
     # ================================================================
     # BACKGROUND RESULT CHECKER & INTERRUPT
     # ================================================================
 
+    def _complete_query(self, query_id: str, result: str):
+        """Stores a query result and hands it to the result checker."""
+        pending = self.pending_queries[query_id]
+        pending.result = result
+        pending.state = QueryState.COMPLETED
+        self._completed_queries.put_nowait(pending)
+
     async def _check_for_completed_queries(self):
         """
-        Checks in the background whether queries have finished.
-        If yes: interrupts VoiceLive and injects the result.
+        Waits in the background for finished queries.
+        As soon as one completes: interrupts VoiceLive and injects the result.
         """
         while True:
-            await asyncio.sleep(0.5)  # Check every 500ms
-
-            for query_id, pending in list(self.pending_queries.items()):
-                if pending.state == QueryState.COMPLETED:
-                    logger.info(
-                        f"[{query_id}] Result ready - interrupting conversation"
-                    )
-                    print(f"\n[RESULT READY - Interrupting...]")
+            pending = await self._completed_queries.get()
+            query_id = pending.query_id
 
-                    # 1. Stop audio
-                    self.audio_processor.skip_pending_audio()
+            logger.info("[%s] Result ready - interrupting conversation", query_id)
+            print(f"\n[RESULT READY - Interrupting...]")
 
-                    # 2. Cancel active response
-                    if self._active_response and not self._response_api_done:
-                        try:
-                            await self.connection.response.cancel()
-                        except Exception:
-                            pass
+            # 1. Stop audio
+            self.audio_processor.skip_pending_audio()
 
-                    # 3. Inject result as assistant message
-                    await self._inject_result(pending.result)
+            # 2. Cancel active response
+            if self._active_response and not self._response_api_done:
+                try:
+                    await self.connection.response.cancel()
+                except Exception:
+                    pass
 
-                    # 4. Mark as injected and remove
-                    pending.state = QueryState.INJECTED
-                    del self.pending_queries[query_id]
+            # 3. Inject result as assistant message
+            try:
+                await self._inject_result(pending.result)
+                pending.state = QueryState.INJECTED
+            except Exception:
+                # Keep the checker alive for the next result
+                logger.exception("[%s] Failed to inject result", query_id)
+            finally:
+                # 4. Remove, whether or not the injection went through
+                self.pending_queries.pop(query_id, None)
 
     async def _inject_result(self, result_text: str):
         """
@@ -636,6 +777,12 @@ def main():
         voice=voice,
     )
 
+    try:
+        # Optional libuv-based event loop (pip install uvloop; not on Windows)
+        from uvloop import run
+    except ImportError:
+        run = asyncio.run
+
     def signal_handler(_sig, _frame):
         raise KeyboardInterrupt()
 
@@ -643,7 +790,7 @@ def main():
     signal.signal(signal.SIGTERM, signal_handler)
 
     try:
-        asyncio.run(assistant.start())
+        run(assistant.start())
     except KeyboardInterrupt:
         print("\nGoodbye!")
 
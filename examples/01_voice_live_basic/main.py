@@ -24,7 +24,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from src.voice_agent.config import VoiceAgentConfig
-from src.voice_agent.voice_live_client import VoiceLiveClient
+from src.voice_agent.voice_live_client import VoiceLiveClient, event_loop_runner
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
@@ -89,4 +89,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop_runner()(main())
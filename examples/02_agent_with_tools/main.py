@@ -26,7 +26,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from src.voice_agent.config import VoiceAgentConfig
-from src.voice_agent.agent_client import FoundryAgentClient
+from src.voice_agent.agent_client import FoundryAgentClient, close_credential
 from src.tools import ALL_TOOLS
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
@@ -68,11 +68,11 @@ async def run_conversation(agent: FoundryAgentClient, conversation: dict) -> Non
     logger.info("=" * 60)
 
     # Create a new thread for each conversation
-    thread_id = agent.create_thread()
+    thread_id = await agent.create_thread()
 
     for message in conversation["messages"]:
         logger.info("Kunde: %s", message)
-        response = agent.process_message(thread_id, message)
+        response = await agent.process_message(thread_id, message)
         logger.info("Agent: %s", response)
         logger.info("-" * 40)
 
@@ -90,6 +90,7 @@ async def main() -> None:
             await run_conversation(agent, conversation)
     finally:
         await agent.cleanup()
+        await close_credential()
 
     logger.info("All conversations completed.")
 
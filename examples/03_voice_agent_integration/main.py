@@ -23,7 +23,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from src.voice_agent.config import VoiceAgentConfig
+from src.voice_agent.agent_client import close_credential
 from src.voice_agent.session_manager import SessionManager
+from src.voice_agent.voice_live_client import event_loop_runner
 from src.tools import ALL_TOOLS
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
@@ -67,6 +69,7 @@ async def main() -> None:
         await simulate_audio_input(session)
     finally:
         await session.stop()
+        await close_credential()
         logger.info("Final state: %s", session.state)
         logger.info("Total turns: %d", session.context.turn_count)
 
@@ -78,4 +81,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop_runner()(main())
@@ -24,7 +24,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from src.voice_agent.config import VoiceAgentConfig
-from src.voice_agent.agent_client import FoundryAgentClient
+from src.voice_agent.agent_client import FoundryAgentClient, close_credential
 from src.tools import ALL_TOOLS
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
@@ -59,7 +59,7 @@ async def main() -> None:
 
     print("Initializing agent...")
     await agent.initialize()
-    thread_id = agent.create_thread()
+    thread_id = await agent.create_thread()
     print("Agent ready!\n")
 
     turn_count = 0
@@ -78,13 +78,14 @@ async def main() -> None:
 
             # Process through the agent (in production, this text comes from Voice Live STT)
             print("Agent: (verarbeitet...)")
-            response = agent.process_message(thread_id, user_input)
+            response = await agent.process_message(thread_id, user_input)
             print(f"Agent: {response}\n")
 
     except (KeyboardInterrupt, EOFError):
         print("\n\nSession beendet.")
     finally:
         await agent.cleanup()
+        await close_credential()
         print(f"\nGesamt-Turns: {turn_count}")
         print("Demo beendet.")
 
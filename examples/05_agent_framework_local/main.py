@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -39,8 +40,20 @@ def load_dataset() -> dict:
     return json.loads(DATA_PATH.read_text(encoding="utf-8"))
 
 
-def build_user_message(user_text: str, dataset: dict) -> str:
-    data_json = json.dumps(dataset, ensure_ascii=False, indent=2)
+@functools.lru_cache(maxsize=1)
+def _serialized_dataset(mtime_ns: int) -> str:
+    # Keyed by the file's mtime, so the file is re-read only after it changes.
+    # Compact JSON: indentation only adds prompt tokens.
+    return json.dumps(load_dataset(), ensure_ascii=False, separators=(",", ":"))
+
+
+def dataset_json() -> str:
+    if not DATA_PATH.exists():
+        raise FileNotFoundError(f"Dataset not found: {DATA_PATH}")
+    return _serialized_dataset(DATA_PATH.stat().st_mtime_ns)
+
+
+def build_user_message(user_text: str, data_json: str) -> str:
     return (
         f"Nutzeranfrage: {user_text}\n\n"
         f"DATEN (JSON):\n{data_json}"
@@ -48,7 +61,7 @@ def build_user_message(user_text: str, dataset: dict) -> str:
 
 
 async def run_agent(user_text: str) -> str:
-    dataset = load_dataset()
+    data_json = dataset_json()
 
     # Prefer dedicated Azure AI project env vars, but allow fallbacks
     project_endpoint = (
@@ -70,14 +83,14 @@ async def run_agent(user_text: str) -> str:
         )
 
     async with AzureCliCredential() as credential:
-    client = AzureAIClient(
-        credential=credential,
-        project_endpoint=project_endpoint,
-        model_deployment_name=model_deployment,
-    )
+        client = AzureAIClient(
+            credential=credential,
+            project_endpoint=project_endpoint,
+            model_deployment_name=model_deployment,
+        )
         agent = client.as_agent(instructions=INSTRUCTIONS)
 
-        message = build_user_message(user_text, dataset)
+        message = build_user_message(user_text, data_json)
         logger.info("Sending user query to agent")
         result = await agent.run(message)
         return getattr(result, "text", str(result))
@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 load_dotenv(Path(__file__).resolve().parent / ".env")
 
 from src.basic_voice_assistant import BasicVoiceAssistant
+from src.event_loop import event_loop_factory
 from src.set_logging import logger
 
 
@@ -121,7 +122,8 @@ def main():
 
     # Start the assistant
     try:
-        asyncio.run(assistant.start())
+        with asyncio.Runner(loop_factory=event_loop_factory()) as runner:
+            runner.run(assistant.start())
     except KeyboardInterrupt:
         print("\n👋 Voice assistant shut down. Goodbye!")
     except Exception as e:
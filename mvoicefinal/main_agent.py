@@ -49,6 +49,7 @@ import pyaudio
 from src.voice_service import VoiceService, VoiceServiceConfig, VoiceEvent, VoiceEventType
 from src.voice_agent_bridge import VoiceAgentBridge, BridgeConfig, ORDER_TOOLS, ORDER_TOOL_CHOICE
 from src.audio_processor import AudioProcessor
+from src.event_loop import event_loop_factory
 from src.set_logging import logger
 from src.order_agent import OrderAgent
 from src.order_backend import JsonFileOrderBackend, HttpOrderBackend
@@ -206,7 +207,7 @@ class AgentVoiceAssistant:
         
         # Stop audio
         if self.audio_processor:
-            self.audio_processor.shutdown()
+            await self.audio_processor.shutdown()
             self.audio_processor = None
         
         # Stop voice service
@@ -478,7 +479,8 @@ def main():
     
     # Run
     try:
-        asyncio.run(run_assistant(args))
+        with asyncio.Runner(loop_factory=event_loop_factory()) as runner:
+            runner.run(run_assistant(args))
     except KeyboardInterrupt:
         print("\n👋 Voice assistant shut down. Goodbye!")
 
@@ -1,31 +1,90 @@
-import base64
+import binascii
+import os
 import asyncio
-import queue
+import threading
+from collections import deque
 from typing import Optional
 import pyaudio
 
+try:
+    import pybase64  # optional SIMD base64: pip install pybase64
+except ImportError:
+    pybase64 = None
+
 from src.set_logging import logger
 
 
+if pybase64 is not None:
+    _b64encode_str = pybase64.b64encode_as_string
+else:
+    def _b64encode_str(data: bytes) -> str:
+        return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+def _raise_thread_priority() -> None:
+    """Best-effort real-time (SCHED_FIFO) scheduling for the calling audio thread.
+
+    Linux only, and it needs CAP_SYS_NICE or an rtprio limit; without them the
+    thread keeps its default priority.
+    """
+    if not hasattr(os, "sched_setscheduler"):
+        return
+    try:
+        priority = int(os.getenv("AUDIO_RT_PRIORITY", "10"))
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        logger.info("Audio capture thread running with real-time priority")
+    except (OSError, ValueError) as e:  # no privilege, or a bad AUDIO_RT_PRIORITY
+        logger.debug("Real-time priority not available for audio capture: %s", e)
+
+
+# AUDIO_LATENCY_MS bounds: shorter buffers underrun, longer ones delay barge-in
+_AUDIO_LATENCY_MS_DEFAULT = 50
+_AUDIO_LATENCY_MS_MIN = 10
+_AUDIO_LATENCY_MS_MAX = 200
+
+
+def _audio_latency_ms() -> int:
+    """AUDIO_LATENCY_MS clamped to 10-200ms; the 50ms default if it is not an integer."""
+    raw = os.getenv("AUDIO_LATENCY_MS")
+    if raw is None:
+        return _AUDIO_LATENCY_MS_DEFAULT
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(
+            "Invalid AUDIO_LATENCY_MS=%r, using %sms", raw, _AUDIO_LATENCY_MS_DEFAULT
+        )
+        return _AUDIO_LATENCY_MS_DEFAULT
+    clamped = min(max(value, _AUDIO_LATENCY_MS_MIN), _AUDIO_LATENCY_MS_MAX)
+    if clamped != value:
+        logger.warning("AUDIO_LATENCY_MS=%s out of range, using %sms", value, clamped)
+    return clamped
+
+
 class AudioProcessor:
     """
     Handles real-time audio capture and playback for the voice assistant.
 
     Threading Architecture:
     - Main thread: Event loop and UI
-    - Capture thread: PyAudio input stream reading
-    - Send thread: Async audio data transmission to VoiceLive
+    - Capture thread: blocking PyAudio reads (only appends raw bytes), so no Python
+      code runs on PortAudio's realtime callback thread
+    - Send task: base64-encodes captured audio on the event loop and sends it to VoiceLive
     - Playback thread: PyAudio output stream writing
     """
 
     loop: asyncio.AbstractEventLoop
 
-    class AudioPlaybackPacket:
-        """Represents a packet that can be sent to the audio playback queue."""
+    # Captured audio sent per append: one WebSocket frame and one loop wakeup
+    # per batch instead of per chunk, well under the VAD silence window
+    CAPTURE_BATCH_MS = 200
+    # Captured audio kept while the sender is stalled; older chunks are dropped
+    # so a slow connection cannot grow the backlog or replay stale speech
+    MAX_CAPTURE_BACKLOG_MS = 5000
 
-        def __init__(self, seq_num: int, data: Optional[bytes]):
-            self.seq_num = seq_num
-            self.data = data
+    # Playback ring buffer size in bytes (~87s of 24kHz PCM16 mono); when full,
+    # the oldest audio is dropped
+    PLAYBACK_BUFFER_BYTES = 1 << 22
 
     def __init__(self, connection):
         self.connection = connection
@@ -35,34 +94,66 @@ class AudioProcessor:
         self.format = pyaudio.paInt16
         self.channels = 1
         self.rate = 24000
-        self.chunk_size = 1200  # 50ms
+        # Frames per PortAudio buffer (50ms by default); lower AUDIO_LATENCY_MS
+        # for snappier barge-in at the cost of more audio callbacks per second
+        latency_ms = _audio_latency_ms()
+        self.chunk_size = self.rate * latency_ms // 1000
+        # Chunks per append and chunks kept in the backlog at this latency
+        self._capture_batch = max(1, self.CAPTURE_BATCH_MS // latency_ms)
 
         # Capture and playback state
         self.input_stream = None
-
-        self.playback_queue: queue.Queue[AudioProcessor.AudioPlaybackPacket] = queue.Queue()
-        self.playback_base = 0
-        self.next_seq_num = 0
+        self._capture_chunks: deque[Optional[bytes]] = deque(
+            maxlen=self.MAX_CAPTURE_BACKLOG_MS // latency_ms
+        )  # None stops the sender
+        self._capture_ready = asyncio.Event()
+        self._capture_wakeup_pending = False
+        self._capture_task: Optional[asyncio.Task] = None
+        self._capture_thread: Optional[threading.Thread] = None
+        self._capture_running = False
+
+        # Playback ring buffer: queue_audio is the only writer of _play_tail, the
+        # playback callback the only writer of _play_head. Positions are running
+        # byte counts (index = position % size), so no lock is needed.
+        self._play_ring = bytearray(self.PLAYBACK_BUFFER_BYTES)
+        self._play_view = memoryview(self._play_ring)  # shared by writer and callback
+        self._play_head = 0
+        self._play_tail = 0
+        self._play_skip_to = 0  # set by skip_pending_audio, applied by the callback
+        self._play_eos = False
         self.output_stream: Optional[pyaudio.Stream] = None
 
         logger.info("AudioProcessor initialized with 24kHz PCM16 mono audio")
 
+    def _capture_loop(self):
+        """Audio capture thread - blocks in PortAudio's read, keeps Python work minimal."""
+        # Keep GC and event-loop work from delaying reads into input overflows
+        _raise_thread_priority()
+        read = self.input_stream.read
+        chunks = self._capture_chunks
+        chunk_size = self.chunk_size
+        batch = self._capture_batch
+        wake_sender = self.loop.call_soon_threadsafe
+        capture_ready = self._capture_ready.set
+        try:
+            while self._capture_running:
+                chunks.append(read(chunk_size, exception_on_overflow=False))
+                if not self._capture_wakeup_pending and len(chunks) >= batch:
+                    # One loop wakeup per full batch instead of one coroutine per chunk
+                    self._capture_wakeup_pending = True
+                    wake_sender(capture_ready)
+        except OSError:
+            logger.exception("Audio capture stopped")
+
     def start_capture(self):
         """Start capturing audio from microphone."""
 
-        def _capture_callback(
-            in_data, _frame_count, _time_info, _status_flags  # data  # number of frames  # dictionary
-        ):
-            """Audio capture thread - runs in background."""
-            audio_base64 = base64.b64encode(in_data).decode("utf-8")
-            asyncio.run_coroutine_threadsafe(self.connection.input_audio_buffer.append(audio=audio_base64), self.loop)
-            return (None, pyaudio.paContinue)
-
         if self.input_stream:
             return
 
         # Store the current event loop for use in threads
-        self.loop = asyncio.get_event_loop()
+        self.loop = asyncio.get_running_loop()
+        self._capture_task = self.loop.create_task(self._send_captured_audio())
 
         try:
             self.input_stream = self.audio.open(
@@ -71,59 +162,80 @@ class AudioProcessor:
                 rate=self.rate,
                 input=True,
                 frames_per_buffer=self.chunk_size,
-                stream_callback=_capture_callback,
             )
+            self._capture_running = True
+            self._capture_thread = threading.Thread(
+                target=self._capture_loop, name="audio-capture", daemon=True
+            )
+            self._capture_thread.start()
             logger.info("Started audio capture")
 
         except Exception:
             logger.exception("Failed to start audio capture")
             raise
 
+    async def _send_captured_audio(self):
+        """Send task: base64-encode captured chunks and append them to the input buffer."""
+        chunks = self._capture_chunks
+        batch = self._capture_batch
+        try:
+            while True:
+                await self._capture_ready.wait()
+                self._capture_ready.clear()
+                self._capture_wakeup_pending = False
+                while chunks:
+                    if chunks[0] is None:  # end-of-capture sentinel from shutdown
+                        return
+                    if len(chunks) < batch:
+                        break  # the rest goes out with the next full batch
+                    data = b"".join([chunks.popleft() for _ in range(batch)])
+                    audio_base64 = _b64encode_str(data)
+                    await self.connection.input_audio_buffer.append(audio=audio_base64)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Error sending captured audio")
+
     def start_playback(self):
         """Initialize audio playback system."""
         if self.output_stream:
             return
 
-        remaining = bytes()
+        ring = self._play_view
+        ring_size = len(ring)
+        sample_width = pyaudio.get_sample_size(self.format)
+        out_buf = bytearray(self.chunk_size * sample_width)
+        out = memoryview(out_buf)
+        silence = bytes(len(out_buf))
 
         def _playback_callback(_in_data, frame_count, _time_info, _status_flags):  # number of frames
+            nonlocal out_buf, out, silence
+            nbytes = frame_count * sample_width
+            if nbytes > len(out_buf):
+                out_buf = bytearray(nbytes)
+                out = memoryview(out_buf)
+                silence = bytes(nbytes)
+
+            head = max(self._play_head, self._play_skip_to)
+            n = min(self._play_tail - head, nbytes)
+            if n > 0:
+                start = head % ring_size
+                first = min(n, ring_size - start)
+                out[:first] = ring[start:start + first]
+                if first < n:
+                    out[first:n] = ring[:n - first]
+                head += n
+            else:
+                n = 0
+            self._play_head = head
 
-            nonlocal remaining
-            frame_count *= pyaudio.get_sample_size(pyaudio.paInt16)
-
-            out = remaining[:frame_count]
-            remaining = remaining[frame_count:]
-
-            while len(out) < frame_count:
-                try:
-                    packet = self.playback_queue.get_nowait()
-                except queue.Empty:
-                    out = out + bytes(frame_count - len(out))
-                    continue
-                except Exception:
-                    logger.exception("Error in audio playback")
-                    raise
-
-                if not packet or not packet.data:
-                    # None packet indicates end of stream
+            if n < nbytes:
+                if self._play_eos:
+                    # End of stream requested via queue_audio(None)
                     logger.info("End of playback queue.")
-                    break
-
-                if packet.seq_num < self.playback_base:
-                    # skip requested
-                    # ignore skipped packet and clear remaining
-                    if len(remaining) > 0:
-                        remaining = bytes()
-                    continue
-
-                num_to_take = frame_count - len(out)
-                out = out + packet.data[:num_to_take]
-                remaining = packet.data[num_to_take:]
-
-            if len(out) >= frame_count:
-                return (out, pyaudio.paContinue)
-            else:
-                return (out, pyaudio.paComplete)
+                    return (bytes(out[:n]), pyaudio.paComplete)
+                out[n:nbytes] = silence[:nbytes - n]
+            return (bytes(out[:nbytes]), pyaudio.paContinue)
 
         try:
             self.output_stream = self.audio.open(
@@ -139,27 +251,57 @@ class AudioProcessor:
             logger.exception("Failed to initialize audio playback")
             raise
 
-    def _get_and_increase_seq_num(self):
-        seq = self.next_seq_num
-        self.next_seq_num += 1
-        return seq
-
     def queue_audio(self, audio_data: Optional[bytes]) -> None:
-        """Queue audio data for playback."""
-        self.playback_queue.put(
-            AudioProcessor.AudioPlaybackPacket(seq_num=self._get_and_increase_seq_num(), data=audio_data)
-        )
+        """Queue audio data for playback. ``None`` (or empty) ends the playback stream."""
+        if not audio_data:
+            self._play_eos = True
+            return
+
+        ring = self._play_view
+        ring_size = len(ring)
+        tail = self._play_tail
+        src = memoryview(audio_data)
+        if len(src) > ring_size:
+            src = src[-ring_size:]
+        n = len(src)
+        overflow = tail + n - ring_size - max(self._play_head, self._play_skip_to)
+        if overflow > 0:
+            # Drop the oldest queued audio rather than the newest, so playback
+            # latency stays bounded by the ring size instead of stalling behind it
+            logger.warning("Playback buffer full, dropping %d bytes of old audio", overflow)
+            self._play_skip_to = tail + n - ring_size
+
+        start = tail % ring_size
+        first = min(n, ring_size - start)
+        ring[start:start + first] = src[:first]
+        if first < n:
+            ring[:n - first] = src[first:n]
+        # Publish only after the bytes are in place
+        self._play_tail = tail + n
 
     def skip_pending_audio(self):
         """Skip current audio in playback queue."""
-        self.playback_base = self._get_and_increase_seq_num()
+        self._play_skip_to = self._play_tail
 
-    def shutdown(self):
+    async def shutdown(self):
         """Clean up audio resources."""
+        if self._capture_thread:
+            # Let the pending read (at most one chunk) finish before closing the stream
+            self._capture_running = False
+            self._capture_thread.join()
+            self._capture_thread = None
         if self.input_stream:
             self.input_stream.stop_stream()
             self.input_stream.close()
             self.input_stream = None
+        if self._capture_task:
+            # The reader has exited, so no more chunks can arrive: drop the
+            # unsent ones and wait for the sender to see the sentinel and exit
+            self._capture_chunks.clear()
+            self._capture_chunks.append(None)
+            self._capture_ready.set()
+            await self._capture_task
+            self._capture_task = None
 
         logger.info("Stopped audio capture")
 
@@ -88,7 +88,7 @@ class BasicVoiceAssistant:
     async def shutdown(self):
         """Clean up resources."""
         if self.audio_processor:
-            self.audio_processor.shutdown()
+            await self.audio_processor.shutdown()
             self.audio_processor = None
         
         await self.voice_service.stop()
@@ -0,0 +1,14 @@
+import asyncio
+from typing import Callable, Optional
+
+
+def event_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Returns uvloop's loop factory if installed (not on Windows), else None.
+
+    Pass the result to ``asyncio.Runner(loop_factory=...)``.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
@@ -683,10 +683,10 @@ class VoiceAgentBridge:
             )
 
         # Order-by-id response: pass the full order payload to the voice model (so it can
-        # summarize without hallucinating).
+        # summarize without hallucinating). Compact JSON: indentation only adds tokens.
         if "id" in data and "status" in data:
             order_payload = {k: v for k, v in data.items() if k != "found"}
-            return "order:\n" + json.dumps(order_payload, ensure_ascii=False, indent=2, sort_keys=True)
+            return "order:\n" + json.dumps(order_payload, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
 
         # Orders-by-customer / list-all response.
         orders = data.get("orders")
@@ -697,7 +697,7 @@ class VoiceAgentBridge:
 
             payload = {k: v for k, v in data.items() if k != "found"}
             payload["order_count"] = len(orders)
-            return "orders:\n" + json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True)
+            return "orders:\n" + json.dumps(payload, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
 
         return None
     
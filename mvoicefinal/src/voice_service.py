@@ -14,7 +14,7 @@ This module provides a controllable voice service that can:
 from __future__ import annotations
 
 import asyncio
-import base64
+import binascii
 from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass, field
 from enum import Enum
@@ -153,6 +153,22 @@ class VoiceService:
         self._pending_response_request = False
         self._base_instructions = config.instructions
 
+        # Server event type -> handler, built once so each event costs one dict lookup
+        self._server_event_handlers: dict[ServerEventType, Callable[[Any], Awaitable[None]]] = {
+            ServerEventType.SESSION_UPDATED: self._on_session_updated,
+            ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED: self._on_speech_started,
+            ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED: self._on_speech_stopped,
+            ServerEventType.RESPONSE_CREATED: self._on_response_created,
+            ServerEventType.RESPONSE_AUDIO_DELTA: self._on_audio_delta,
+            ServerEventType.RESPONSE_AUDIO_DONE: self._on_audio_done,
+            ServerEventType.RESPONSE_DONE: self._on_response_done,
+            ServerEventType.ERROR: self._on_error,
+            ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED: self._on_transcription_completed,
+            ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_FAILED: self._on_transcription_failed,
+            ServerEventType.RESPONSE_FUNCTION_CALL_ARGUMENTS_DONE: self._on_function_call_arguments_done,
+            ServerEventType.CONVERSATION_ITEM_CREATED: self._on_item_created,
+        }
+
     @property
     def connection(self) -> Optional["VoiceLiveConnection"]:
         """Get the underlying VoiceLive connection (for advanced usage)."""
@@ -268,7 +284,7 @@ class VoiceService:
             logger.warning("Cannot send audio: session not ready")
             return
 
-        audio_base64 = base64.b64encode(audio_data).decode("utf-8")
+        audio_base64 = binascii.b2a_base64(audio_data, newline=False).decode("ascii")
         await self._connection.input_audio_buffer.append(audio=audio_base64)
 
     async def send_audio_base64(self, audio_base64: str) -> None:
@@ -499,128 +515,135 @@ class VoiceService:
 
     async def _handle_event(self, event) -> None:
         """Handle events from VoiceLive and emit corresponding VoiceEvents."""
-        logger.debug("Received event: %s", event.type)
-
-        if event.type == ServerEventType.SESSION_UPDATED:
-            logger.info("Session ready: %s", event.session.id)
-            self._session_ready = True
-
-        elif event.type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED:
-            logger.info("User started speaking")
-            await self._emit_event(VoiceEvent(type=VoiceEventType.SPEECH_STARTED))
-            
-            # Handle barge-in
-            if self._active_response and not self._response_api_done:
-                await self.cancel_response()
-
-        elif event.type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED:
-            logger.info("User stopped speaking")
-            await self._emit_event(VoiceEvent(type=VoiceEventType.SPEECH_ENDED))
-
-        elif event.type == ServerEventType.RESPONSE_CREATED:
-            logger.info("Assistant response started")
-            self._active_response = True
-            self._response_api_done = False
-            await self._emit_event(VoiceEvent(type=VoiceEventType.RESPONSE_STARTED))
-
-        elif event.type == ServerEventType.RESPONSE_AUDIO_DELTA:
-            # Decode and emit audio data
-            audio_bytes = base64.b64decode(event.delta) if isinstance(event.delta, str) else event.delta
+        # Read once: SDK models re-deserialize on every attribute access
+        event_type = event.type
+        logger.debug("Received event: %s", event_type)
+        handler = self._server_event_handlers.get(event_type)
+        if handler is not None:
+            await handler(event)
+
+    async def _on_session_updated(self, event) -> None:
+        logger.info("Session ready: %s", event.session.id)
+        self._session_ready = True
+
+    async def _on_speech_started(self, event) -> None:
+        logger.info("User started speaking")
+        await self._emit_event(VoiceEvent(type=VoiceEventType.SPEECH_STARTED))
+        
+        # Handle barge-in
+        if self._active_response and not self._response_api_done:
+            await self.cancel_response()
+
+    async def _on_speech_stopped(self, event) -> None:
+        logger.info("User stopped speaking")
+        await self._emit_event(VoiceEvent(type=VoiceEventType.SPEECH_ENDED))
+
+    async def _on_response_created(self, event) -> None:
+        logger.info("Assistant response started")
+        self._active_response = True
+        self._response_api_done = False
+        await self._emit_event(VoiceEvent(type=VoiceEventType.RESPONSE_STARTED))
+
+    async def _on_audio_delta(self, event) -> None:
+        # The SDK base64-decodes on every attribute access, so read it once
+        audio_bytes = event.delta
+        if isinstance(audio_bytes, str):
+            audio_bytes = binascii.a2b_base64(audio_bytes)
+        await self._emit_event(VoiceEvent(
+            type=VoiceEventType.RESPONSE_AUDIO,
+            data={"audio": audio_bytes}
+        ))
+
+    async def _on_audio_done(self, event) -> None:
+        logger.info("Assistant audio complete")
+
+    async def _on_response_done(self, event) -> None:
+        logger.info("Response complete")
+        self._active_response = False
+        self._response_api_done = True
+        await self._emit_event(VoiceEvent(type=VoiceEventType.RESPONSE_ENDED))
+
+        if self._pending_response_request and self._connection:
+            self._pending_response_request = False
+            print("   [VoiceService] Firing deferred response.create()")
+            try:
+                await self._connection.response.create()
+            except Exception as e:
+                logger.debug("Deferred response.create failed: %s", e)
+                print(f"   [VoiceService] Deferred response.create() FAILED: {e}")
+
+    async def _on_error(self, event) -> None:
+        msg = event.error.message
+        if "Cancellation failed: no active response" not in msg:
+            logger.error("VoiceLive error: %s", msg)
             await self._emit_event(VoiceEvent(
-                type=VoiceEventType.RESPONSE_AUDIO,
-                data={"audio": audio_bytes}
+                type=VoiceEventType.ERROR,
+                data={"error": msg}
             ))
 
-        elif event.type == ServerEventType.RESPONSE_AUDIO_DONE:
-            logger.info("Assistant audio complete")
-
-        elif event.type == ServerEventType.RESPONSE_DONE:
-            logger.info("Response complete")
-            self._active_response = False
-            self._response_api_done = True
-            await self._emit_event(VoiceEvent(type=VoiceEventType.RESPONSE_ENDED))
-
-            if self._pending_response_request and self._connection:
-                self._pending_response_request = False
-                print("   [VoiceService] Firing deferred response.create()")
-                try:
-                    await self._connection.response.create()
-                except Exception as e:
-                    logger.debug("Deferred response.create failed: %s", e)
-                    print(f"   [VoiceService] Deferred response.create() FAILED: {e}")
-
-        elif event.type == ServerEventType.ERROR:
-            msg = event.error.message
-            if "Cancellation failed: no active response" not in msg:
-                logger.error("VoiceLive error: %s", msg)
-                await self._emit_event(VoiceEvent(
-                    type=VoiceEventType.ERROR,
-                    data={"error": msg}
-                ))
-
-        elif event.type == ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED:
-            # User's speech has been transcribed
-            logger.debug("Received transcription event: %s", event)
-            transcript = getattr(event, 'transcript', None)
-            if transcript:
-                logger.info("User transcript: %s", transcript[:100])
-                await self._emit_event(VoiceEvent(
-                    type=VoiceEventType.TRANSCRIPT,
-                    data={
-                        "role": "user",
-                        "transcript": transcript
-                    }
-                ))
-            else:
-                logger.warning("Transcription event received but no transcript attribute found")
-
-        elif event.type == ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_FAILED:
-            # Transcription failed
-            error_msg = getattr(event, 'error', None)
-            logger.error("Transcription failed: %s", error_msg)
-
-        elif event.type == ServerEventType.RESPONSE_FUNCTION_CALL_ARGUMENTS_DONE:
-            # Function call arguments are fully streamed — ready to execute
-            fn_name = getattr(event, "name", "?")
-            fn_args = getattr(event, "arguments", "")
-            fn_call_id = getattr(event, "call_id", "?")
-            logger.info("Function call arguments done: %s(%s) call_id=%s", fn_name, fn_args, fn_call_id)
-            print(f"   [VoiceLive] FUNCTION_CALL_ARGUMENTS_DONE: {fn_name}({fn_args})")
+    async def _on_transcription_completed(self, event) -> None:
+        # User's speech has been transcribed
+        logger.debug("Received transcription event: %s", event)
+        transcript = getattr(event, 'transcript', None)
+        if transcript:
+            logger.info("User transcript: %s", transcript[:100])
+            await self._emit_event(VoiceEvent(
+                type=VoiceEventType.TRANSCRIPT,
+                data={
+                    "role": "user",
+                    "transcript": transcript
+                }
+            ))
+        else:
+            logger.warning("Transcription event received but no transcript attribute found")
+
+    async def _on_transcription_failed(self, event) -> None:
+        # Transcription failed
+        error_msg = getattr(event, 'error', None)
+        logger.error("Transcription failed: %s", error_msg)
+
+    async def _on_function_call_arguments_done(self, event) -> None:
+        # Function call arguments are fully streamed — ready to execute
+        fn_name = getattr(event, "name", "?")
+        fn_args = getattr(event, "arguments", "")
+        fn_call_id = getattr(event, "call_id", "?")
+        logger.info("Function call arguments done: %s(%s) call_id=%s", fn_name, fn_args, fn_call_id)
+        print(f"   [VoiceLive] FUNCTION_CALL_ARGUMENTS_DONE: {fn_name}({fn_args})")
+        await self._emit_event(VoiceEvent(
+            type=VoiceEventType.FUNCTION_CALL_ARGUMENTS_DONE,
+            data={
+                "name": fn_name,
+                "call_id": fn_call_id,
+                "arguments": fn_args,
+            }
+        ))
+
+    async def _on_item_created(self, event) -> None:
+        item = event.item
+        # Detect function_call items
+        if getattr(item, "type", None) == ItemType.FUNCTION_CALL:
+            fn_name = getattr(item, "name", "?")
+            fn_call_id = getattr(item, "call_id", "?")
+            fn_item_id = getattr(item, "id", "?")
+            logger.info("Function call item created: %s call_id=%s item_id=%s", fn_name, fn_call_id, fn_item_id)
+            print(f"   [VoiceLive] CONVERSATION_ITEM_CREATED (function_call): {fn_name} call_id={fn_call_id}")
             await self._emit_event(VoiceEvent(
-                type=VoiceEventType.FUNCTION_CALL_ARGUMENTS_DONE,
+                type=VoiceEventType.FUNCTION_CALL_STARTED,
                 data={
                     "name": fn_name,
                     "call_id": fn_call_id,
-                    "arguments": fn_args,
+                    "item_id": fn_item_id,
                 }
             ))
 
-        elif event.type == ServerEventType.CONVERSATION_ITEM_CREATED:
-            item = event.item
-            # Detect function_call items
-            if getattr(item, "type", None) == ItemType.FUNCTION_CALL:
-                fn_name = getattr(item, "name", "?")
-                fn_call_id = getattr(item, "call_id", "?")
-                fn_item_id = getattr(item, "id", "?")
-                logger.info("Function call item created: %s call_id=%s item_id=%s", fn_name, fn_call_id, fn_item_id)
-                print(f"   [VoiceLive] CONVERSATION_ITEM_CREATED (function_call): {fn_name} call_id={fn_call_id}")
-                await self._emit_event(VoiceEvent(
-                    type=VoiceEventType.FUNCTION_CALL_STARTED,
-                    data={
-                        "name": fn_name,
-                        "call_id": fn_call_id,
-                        "item_id": fn_item_id,
-                    }
-                ))
-
-            # Check for transcript in conversation items (assistant responses)
-            if hasattr(item, 'content') and item.content:
-                for content in item.content:
-                    if hasattr(content, 'transcript') and content.transcript:
-                        await self._emit_event(VoiceEvent(
-                            type=VoiceEventType.TRANSCRIPT,
-                            data={
-                                "role": item.role if hasattr(item, 'role') else "unknown",
-                                "transcript": content.transcript
-                            }
-                        ))
+        # Check for transcript in conversation items (assistant responses)
+        if hasattr(item, 'content') and item.content:
+            for content in item.content:
+                if hasattr(content, 'transcript') and content.transcript:
+                    await self._emit_event(VoiceEvent(
+                        type=VoiceEventType.TRANSCRIPT,
+                        data={
+                            "role": item.role if hasattr(item, 'role') else "unknown",
+                            "transcript": content.transcript
+                        }
+                    ))
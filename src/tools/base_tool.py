@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -21,61 +22,61 @@ class MockBackendClient:
     your CRM, ERP, calendar, and ticketing APIs.
     """
 
-    # Simulated customer database
-    CUSTOMERS = {
-        "C-1001": {
+    # Simulated customer database (read-only; tools return copies)
+    CUSTOMERS = MappingProxyType({
+        "C-1001": MappingProxyType({
             "id": "C-1001",
             "name": "Maria Schmidt",
             "email": "maria.schmidt@example.com",
             "phone": "+49 170 1234567",
             "tier": "premium",
-        },
-        "C-1002": {
+        }),
+        "C-1002": MappingProxyType({
             "id": "C-1002",
             "name": "Thomas Müller",
             "email": "thomas.mueller@example.com",
             "phone": "+49 171 9876543",
             "tier": "standard",
-        },
-    }
+        }),
+    })
 
-    # Simulated orders
-    ORDERS = {
-        "ORD-5001": {
+    # Simulated orders (read-only; tools return copies)
+    ORDERS = MappingProxyType({
+        "ORD-5001": MappingProxyType({
             "id": "ORD-5001",
             "customer_id": "C-1001",
             "status": "in_transit",
-            "items": ["Laptop Stand", "USB-C Hub"],
+            "items": ("Laptop Stand", "USB-C Hub"),
             "estimated_delivery": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d"),
             "delivery_window": "10:00-14:00",
-        },
-        "ORD-5002": {
+        }),
+        "ORD-5002": MappingProxyType({
             "id": "ORD-5002",
             "customer_id": "C-1001",
             "status": "delivered",
-            "items": ["Wireless Mouse"],
+            "items": ("Wireless Mouse",),
             "delivered_at": (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d"),
-        },
-        "ORD-5003": {
+        }),
+        "ORD-5003": MappingProxyType({
             "id": "ORD-5003",
             "customer_id": "C-1002",
             "status": "processing",
-            "items": ["Monitor", "HDMI Cable"],
+            "items": ("Monitor", "HDMI Cable"),
             "estimated_delivery": (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d"),
-        },
-    }
+        }),
+    })
 
     # Simulated calendar slots
     @staticmethod
-    def get_available_slots(date: str) -> list[dict[str, str]]:
+    def get_available_slots(date: str) -> tuple[dict[str, Any], ...]:
         """Return mock available appointment slots for a given date."""
-        return [
+        return (
             {"time": "09:00", "duration": "30min", "available": True},
             {"time": "10:00", "duration": "30min", "available": True},
             {"time": "11:00", "duration": "30min", "available": False},
             {"time": "14:00", "duration": "30min", "available": True},
             {"time": "15:30", "duration": "30min", "available": True},
-        ]
+        )
 
     # Ticket counter for generating IDs
     _ticket_counter = 7000
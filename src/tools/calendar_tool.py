@@ -20,6 +20,9 @@ from .base_tool import MockBackendClient
 
 logger = logging.getLogger(__name__)
 
+# Strips date/time separators when building appointment IDs
+_STRIP_PUNCT = str.maketrans("", "", "-:")
+
 
 def check_availability(
     date: Annotated[str, Field(description="Date to check in YYYY-MM-DD format")]
@@ -27,7 +30,7 @@ def check_availability(
     """Check available appointment slots for a given date. Use this before booking an appointment."""
     logger.info("Calendar check availability: %s", date)
     slots = MockBackendClient.get_available_slots(date)
-    available = [s for s in slots if s["available"]]
+    available = tuple(s for s in slots if s["available"])
     return {
         "date": date,
         "available_slots": available,
@@ -46,7 +49,7 @@ def book_appointment(
     # In production, this would call the calendar API
     return {
         "success": True,
-        "appointment_id": f"APT-{date.replace('-', '')}-{time.replace(':', '')}",
+        "appointment_id": f"APT-{date.translate(_STRIP_PUNCT)}-{time.translate(_STRIP_PUNCT)}",
         "date": date,
         "time": time,
         "customer_id": customer_id,
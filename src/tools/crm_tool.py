@@ -44,5 +44,5 @@ def get_customer_details(
     logger.info("CRM get details: %s", customer_id)
     customer = MockBackendClient.CUSTOMERS.get(customer_id)
     if customer:
-        return customer
+        return dict(customer)
     return {"error": f"Customer {customer_id} not found."}
@@ -26,7 +26,7 @@ def get_recent_orders(
     """Get recent orders for a customer. Use this to find a customer's order history."""
     logger.info("Orders lookup for customer: %s", customer_id)
     orders = [
-        order for order in MockBackendClient.ORDERS.values()
+        dict(order) for order in MockBackendClient.ORDERS.values()
         if order["customer_id"] == customer_id
     ]
     return {
@@ -43,5 +43,5 @@ def get_order_status(
     logger.info("Order status: %s", order_id)
     order = MockBackendClient.ORDERS.get(order_id)
     if order:
-        return order
+        return dict(order)
     return {"error": f"Order {order_id} not found."}
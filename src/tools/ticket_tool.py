@@ -20,6 +20,14 @@ from .base_tool import MockBackendClient
 
 logger = logging.getLogger(__name__)
 
+_VALID_PRIORITIES = frozenset({"low", "medium", "high", "urgent"})
+_VALID_CATEGORIES = frozenset({
+    "damaged_delivery", "missing_item", "wrong_item", "service_complaint", "other",
+})
+
+# Response SLA in hours per priority
+_SLA_HOURS = {"urgent": 4, "high": 24, "medium": 48, "low": 72}
+
 
 def create_ticket(
     customer_id: Annotated[str, Field(description="Customer ID for the ticket")],
@@ -28,12 +36,16 @@ def create_ticket(
     description: Annotated[str, Field(description="Detailed description of the customer's issue")],
 ) -> dict:
     """Create a new support ticket for a customer issue. Use this for complaints, damaged deliveries, or other problems that need follow-up."""
+    # Normalize unexpected values from the LLM to safe defaults
+    if priority not in _VALID_PRIORITIES:
+        priority = "medium"
+    if category not in _VALID_CATEGORIES:
+        category = "other"
+
     ticket_id = MockBackendClient.next_ticket_id()
     logger.info("Ticket created: %s (priority=%s, category=%s)", ticket_id, priority, category)
 
-    # Determine SLA based on priority
-    sla_hours = {"urgent": 4, "high": 24, "medium": 48, "low": 72}
-    response_time = sla_hours.get(priority, 48)
+    response_time = _SLA_HOURS[priority]
 
     return {
         "success": True,
@@ -1,7 +1,9 @@
 """Foundry Agent Service client for AI-powered conversation handling.
 
-Wraps the azure-ai-agents SDK to create and run agents that process
-customer intents, execute tools, and generate responses.
+Wraps the async azure-ai-agents SDK to create and run agents that process
+customer intents, execute tools, and generate responses. All service calls
+are awaited on the event loop, so no worker thread is tied up while a run
+is in progress.
 
 Docs:
 - Overview: https://learn.microsoft.com/en-us/azure/ai-foundry/agents/overview
@@ -12,18 +14,25 @@ Docs:
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
-from azure.ai.agents import AgentsClient
+from azure.ai.agents.aio import AgentsClient
 from azure.ai.agents.models import (
-    FunctionTool,
-    ToolSet,
+    AgentStreamEvent,
+    AsyncFunctionTool,
+    AsyncToolSet,
+    MessageDeltaChunk,
     MessageRole,
     ListSortOrder,
+    TruncationObject,
+    TruncationStrategy,
 )
-from azure.identity import DefaultAzureCredential
+from azure.identity.aio import DefaultAzureCredential
 
 from .config import VoiceAgentConfig
 
@@ -33,6 +42,78 @@ logger = logging.getLogger(__name__)
 _PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
 _SYSTEM_PROMPT_PATH = _PROMPTS_DIR / "system_prompt.md"
 
+_RUN_FAILED_REPLY = "Entschuldigung, es ist ein Fehler aufgetreten. Bitte versuchen Sie es erneut."
+_NO_REPLY = "Entschuldigung, ich konnte Ihre Anfrage nicht verarbeiten."
+
+# Runs only see the newest thread messages (~10 turns), so per-turn latency and
+# token cost stay bounded however long the call goes on
+_HISTORY_WINDOW = TruncationObject(
+    type=TruncationStrategy.LAST_MESSAGES,
+    last_messages=20,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_system_prompt() -> str:
+    """Load the system prompt from the prompts directory (read once per process)."""
+    try:
+        return _SYSTEM_PROMPT_PATH.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        # Fallback prompt
+        return (
+            "Du bist ein freundlicher Kundenservice-Agent. "
+            "Beantworte Kundenanfragen höflich und effizient auf Deutsch. "
+            "Nutze die verfügbaren Tools, um Kundendaten abzurufen, "
+            "Termine zu buchen, Bestellungen zu prüfen und Tickets zu erstellen."
+        )
+
+
+# Shared across clients so re-initializing skips the DefaultAzureCredential
+# probe and reuses its token cache and HTTP session
+_credential: DefaultAzureCredential | None = None
+
+
+def _get_credential() -> DefaultAzureCredential:
+    """Return the process-wide credential, creating it on first use."""
+    global _credential
+    if _credential is None:
+        # Skip chains this app doesn't document (az login, env, managed identity)
+        _credential = DefaultAzureCredential(
+            exclude_shared_token_cache_credential=True,
+            exclude_visual_studio_code_credential=True,
+        )
+    return _credential
+
+
+async def close_credential() -> None:
+    """Close the shared credential and its HTTP session; await once at shutdown.
+
+    Clients initialized afterwards get a fresh credential.
+    """
+    global _credential
+    credential, _credential = _credential, None
+    if credential is not None:
+        await credential.close()
+
+
+# Whitespace after sentence-ending punctuation: where streamed text is cut for TTS.
+# Not after a digit ("am 3. Januar") or a single letter ("z. B."), which in
+# German are ordinals and abbreviations far more often than sentence ends.
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])(?<!\d\.)(?<!\b\w\.)\s+")
+# Shorter fragments are kept together with the text that follows them
+_MIN_SENTENCE_CHARS = 12
+
+
+def _split_sentences(text: str) -> tuple[list[str], str]:
+    """Split streamed text into complete sentences and the unfinished rest."""
+    sentences = []
+    start = 0
+    for match in _SENTENCE_BREAK.finditer(text):
+        if match.start() - start >= _MIN_SENTENCE_CHARS:
+            sentences.append(text[start:match.start()])
+            start = match.end()
+    return sentences, text[start:]
+
 
 class FoundryAgentClient:
     """Client for the Microsoft Foundry Agent Service.
@@ -46,6 +127,7 @@ class FoundryAgentClient:
         config = VoiceAgentConfig()
         agent_client = FoundryAgentClient(config, tools=[crm_tool, calendar_tool])
         await agent_client.initialize()
+        thread_id = await agent_client.create_thread()
 
         response = await agent_client.process_message(thread_id, "Wo ist meine Bestellung?")
         print(response)  # "Ihre Bestellung wird morgen zwischen 10-14 Uhr geliefert."
@@ -67,29 +149,33 @@ class FoundryAgentClient:
         """
         # Initialize the Agents SDK client
         # Docs: https://learn.microsoft.com/en-us/azure/ai-foundry/how-to/develop/sdk-overview
+        # The client stays per instance: auto function calling binds this
+        # instance's toolset to it
         self._client = AgentsClient(
             endpoint=self._config.agent_endpoint,
-            credential=DefaultAzureCredential(),
+            credential=_get_credential(),
         )
 
         # Build ToolSet from registered tool functions.
         # ToolSet enables auto function calling: the SDK automatically
         # executes tool functions when the agent requests them.
         # Docs: https://learn.microsoft.com/en-us/python/api/overview/azure/ai-agents-readme
-        toolset = ToolSet()
+        # The tool functions are plain (in-memory) callables; the async toolset
+        # calls them directly on the loop.
+        toolset = AsyncToolSet()
         if self._tool_functions:
-            functions = FunctionTool(self._tool_functions)
+            functions = AsyncFunctionTool(self._tool_functions)
             toolset.add(functions)
 
         # Enable auto function calling so the SDK handles tool execution
         self._client.enable_auto_function_calls(toolset)
 
         # Load system prompt
-        system_prompt = self._load_system_prompt()
+        system_prompt = _load_system_prompt()
 
         # Create the agent
         # Docs: https://learn.microsoft.com/en-us/azure/ai-foundry/agents/quickstart
-        self._agent = self._client.create_agent(
+        self._agent = await self._client.create_agent(
             model=self._config.model_deployment,
             name="customer-service-voice-agent",
             instructions=system_prompt,
@@ -101,18 +187,18 @@ class FoundryAgentClient:
             self._config.model_deployment,
         )
 
-    def create_thread(self) -> str:
+    async def create_thread(self) -> str:
         """Create a new conversation thread and return its ID.
 
         Each phone call / session should have its own thread to maintain
         conversation context throughout the interaction.
         """
         assert self._client is not None, "Client not initialized"
-        thread = self._client.threads.create()
+        thread = await self._client.threads.create()
         logger.info("Thread created: %s", thread.id)
         return thread.id
 
-    def process_message(self, thread_id: str, user_text: str) -> str:
+    async def process_message(self, thread_id: str, user_text: str) -> str:
         """Send a user message to the agent and get the response.
 
         This is the core conversation loop:
@@ -131,7 +217,7 @@ class FoundryAgentClient:
         assert self._client is not None and self._agent is not None
 
         # Add the user message to the thread
-        self._client.messages.create(
+        await self._client.messages.create(
             thread_id=thread_id,
             role=MessageRole.USER,
             content=user_text,
@@ -139,45 +225,89 @@ class FoundryAgentClient:
 
         # Run the agent - it will process the message, potentially call tools,
         # and generate a response
-        run = self._client.runs.create_and_process(
+        run = await self._client.runs.create_and_process(
             thread_id=thread_id,
             agent_id=self._agent.id,
+            truncation_strategy=_HISTORY_WINDOW,
         )
         logger.info("Agent run completed: status=%s", run.status)
 
         if run.status == "failed":
             logger.error("Agent run failed: %s", run.last_error)
-            return "Entschuldigung, es ist ein Fehler aufgetreten. Bitte versuchen Sie es erneut."
+            return _RUN_FAILED_REPLY
 
-        # Retrieve the latest agent message.
+        # Retrieve only the newest message produced by this run (server-side
+        # filter), instead of scanning the whole thread history.
         # The SDK provides a text_messages helper on each message object.
-        messages = self._client.messages.list(
+        msg = None
+        async for msg in self._client.messages.list(
             thread_id=thread_id,
+            run_id=run.id,
             order=ListSortOrder.DESCENDING,
-        )
+            limit=1,
+        ):
+            break
 
-        for msg in messages:
-            if msg.role == MessageRole.AGENT and msg.text_messages:
-                response_text = msg.text_messages[-1].text.value
+        if msg is not None and msg.role == MessageRole.AGENT and msg.text_messages:
+            response_text = msg.text_messages[-1].text.value
+            if logger.isEnabledFor(logging.INFO):
                 logger.info("Agent response: %s", response_text[:100])
-                return response_text
+            return response_text
 
-        return "Entschuldigung, ich konnte Ihre Anfrage nicht verarbeiten."
+        return _NO_REPLY
+
+    async def stream_message(self, thread_id: str, user_text: str) -> AsyncIterator[str]:
+        """Send a user message and yield the agent's reply sentence by sentence.
+
+        Like :meth:`process_message`, but the run is streamed: each sentence
+        is yielded as soon as its text has arrived, so TTS can start on the
+        first sentence while the agent is still generating the rest. Tool
+        calls are executed automatically during the stream.
+
+        Args:
+            thread_id: The conversation thread ID.
+            user_text: Transcribed speech text from Voice Live STT.
+
+        Yields:
+            Complete sentences of the agent's response, in order.
+        """
+        assert self._client is not None and self._agent is not None
+
+        await self._client.messages.create(
+            thread_id=thread_id,
+            role=MessageRole.USER,
+            content=user_text,
+        )
+
+        buffer = ""
+        replied = False
+        async with await self._client.runs.stream(
+            thread_id=thread_id,
+            agent_id=self._agent.id,
+            truncation_strategy=_HISTORY_WINDOW,
+        ) as stream:
+            async for event_type, event_data, _ in stream:
+                if isinstance(event_data, MessageDeltaChunk):
+                    sentences, buffer = _split_sentences(buffer + event_data.text)
+                    for sentence in sentences:
+                        replied = True
+                        yield sentence
+                elif event_type == AgentStreamEvent.THREAD_RUN_FAILED:
+                    logger.error("Agent run failed: %s", event_data.last_error)
+                    yield _RUN_FAILED_REPLY
+                    return
+
+        if buffer.strip():
+            yield buffer.strip()
+        elif not replied:
+            yield _NO_REPLY
 
     async def cleanup(self) -> None:
         """Delete the agent and free resources."""
         if self._client and self._agent:
-            self._client.delete_agent(self._agent.id)
+            await self._client.delete_agent(self._agent.id)
             logger.info("Agent deleted: %s", self._agent.id)
-
-    def _load_system_prompt(self) -> str:
-        """Load the system prompt from the prompts directory."""
-        if _SYSTEM_PROMPT_PATH.exists():
-            return _SYSTEM_PROMPT_PATH.read_text(encoding="utf-8")
-        # Fallback prompt
-        return (
-            "Du bist ein freundlicher Kundenservice-Agent. "
-            "Beantworte Kundenanfragen höflich und effizient auf Deutsch. "
-            "Nutze die verfügbaren Tools, um Kundendaten abzurufen, "
-            "Termine zu buchen, Bestellungen zu prüfen und Tickets zu erstellen."
-        )
+        if self._client:
+            await self._client.close()
+        # The shared credential stays open for the next client; close_credential()
+        # releases it at shutdown
@@ -0,0 +1,65 @@
+"""Base64 and JSON helpers for the Voice Live hot paths.
+
+Audio chunks are base64-encoded on every send (~50 per second per session)
+and every server event is a JSON document, so this module uses the
+SIMD-accelerated ``pybase64`` and ``orjson`` packages when they are
+installed and falls back to the stdlib ``binascii``/``json`` otherwise.
+
+Install the optional speedups with: ``pip install pybase64 orjson``
+"""
+
+from __future__ import annotations
+
+import binascii
+import json
+from typing import Any
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - depends on the environment
+    pybase64 = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+if pybase64 is not None:
+    def b64encode(data: bytes | memoryview) -> bytes:
+        """Base64-encode ``data`` to ASCII bytes (no trailing newline)."""
+        return pybase64.b64encode(data)
+
+    def b64encode_str(data: bytes | memoryview) -> str:
+        """Base64-encode ``data`` directly to a ``str``."""
+        return pybase64.b64encode_as_string(data)
+
+    def b64decode(data: str | bytes | memoryview) -> bytes:
+        """Decode base64 ``data`` (ASCII ``str`` or bytes) to raw bytes."""
+        return pybase64.b64decode(data)
+else:
+    def b64encode(data: bytes | memoryview) -> bytes:
+        """Base64-encode ``data`` to ASCII bytes (no trailing newline)."""
+        return binascii.b2a_base64(data, newline=False)
+
+    def b64encode_str(data: bytes | memoryview) -> str:
+        """Base64-encode ``data`` directly to a ``str``."""
+        return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+    def b64decode(data: str | bytes | memoryview) -> bytes:
+        """Decode base64 ``data`` (ASCII ``str`` or bytes) to raw bytes."""
+        return binascii.a2b_base64(data)
+
+
+if orjson is not None:
+    def json_dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON ``str`` (sent as a text frame)."""
+        return orjson.dumps(obj).decode("utf-8")
+
+    json_loads = orjson.loads
+else:
+    def json_dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON ``str`` (sent as a text frame)."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    json_loads = json.loads
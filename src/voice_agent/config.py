@@ -8,35 +8,52 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import cached_property
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-@dataclass
+def _env(*names: str, default: str | None = None, required: bool = False) -> str | None:
+    """Return the first non-empty environment variable among ``names``.
+
+    Raises KeyError (naming the primary variable) if ``required`` and none is set.
+    """
+    environ = os.environ
+    for name in names:
+        value = environ.get(name)
+        if value:
+            return value
+    if required:
+        raise KeyError(names[0])
+    return default
+
+
+@dataclass(frozen=True)
 class VoiceLiveConfig:
     """Voice Live API session configuration.
 
+    Instances are frozen so the session payload can be built once and cached.
+
     Docs: https://learn.microsoft.com/en-us/azure/ai-services/speech-service/voice-live
     """
 
     voice_name: str = field(
-        default_factory=lambda: (
-            os.getenv("AZURE_VOICELIVE_VOICE")
-            or os.getenv("VOICE_LIVE_VOICE", "de-DE-ConradNeural")
+        default_factory=lambda: _env(
+            "AZURE_VOICELIVE_VOICE", "VOICE_LIVE_VOICE", default="de-DE-ConradNeural"
         )
     )
     api_version: str = field(
-        default_factory=lambda: (
-            os.getenv("AZURE_VOICELIVE_API_VERSION")
-            or os.getenv("VOICE_LIVE_API_VERSION", "2025-10-01")
+        default_factory=lambda: _env(
+            "AZURE_VOICELIVE_API_VERSION", "VOICE_LIVE_API_VERSION", default="2025-10-01"
         )
     )
     transcription_model: str = field(
-        default_factory=lambda: (
-            os.getenv("AZURE_VOICELIVE_TRANSCRIPTION_MODEL")
-            or os.getenv("VOICE_LIVE_TRANSCRIPTION_MODEL", "azure-speech")
+        default_factory=lambda: _env(
+            "AZURE_VOICELIVE_TRANSCRIPTION_MODEL",
+            "VOICE_LIVE_TRANSCRIPTION_MODEL",
+            default="azure-speech",
         )
     )
     input_audio_format: str = "pcm16"
@@ -49,8 +66,9 @@ class VoiceLiveConfig:
     noise_reduction_type: str = "azure_deep_noise_suppression"
     voice_temperature: float = 0.8  # Valid range: 0.6-1.2 per API docs
 
-    def to_session_config(self) -> dict:
-        """Build the Voice Live session configuration payload."""
+    @cached_property
+    def session_config(self) -> dict:
+        """Voice Live session configuration payload (built once per instance)."""
         return {
             "modalities": ["text", "audio"],
             "voice": {
@@ -75,6 +93,10 @@ class VoiceLiveConfig:
             },
         }
 
+    def to_session_config(self) -> dict:
+        """Return the Voice Live session configuration payload."""
+        return self.session_config
+
 
 @dataclass
 class VoiceAgentConfig:
@@ -87,22 +109,19 @@ class VoiceAgentConfig:
 
     # Azure AI Foundry endpoint
     endpoint: str = field(
-        default_factory=lambda: (
-            os.getenv("AZURE_FOUNDRY_ENDPOINT")
-            or os.getenv("AZURE_VOICELIVE_ENDPOINT")
-            or os.environ["AZURE_FOUNDRY_ENDPOINT"]
+        default_factory=lambda: _env(
+            "AZURE_FOUNDRY_ENDPOINT", "AZURE_VOICELIVE_ENDPOINT", required=True
         )
     )
     project_name: str = field(
-        default_factory=lambda: os.environ["PROJECT_NAME"]
+        default_factory=lambda: _env("PROJECT_NAME", required=True)
     )
     model_deployment: str = field(
-        default_factory=lambda: os.getenv("MODEL_DEPLOYMENT_NAME", "gpt-4.1")
+        default_factory=lambda: _env("MODEL_DEPLOYMENT_NAME", default="gpt-4.1")
     )
     voice_live_model: str = field(
-        default_factory=lambda: (
-            os.getenv("AZURE_VOICELIVE_MODEL")
-            or os.getenv("VOICE_LIVE_MODEL", "gpt-realtime")
+        default_factory=lambda: _env(
+            "AZURE_VOICELIVE_MODEL", "VOICE_LIVE_MODEL", default="gpt-realtime"
         )
     )
 
@@ -111,7 +130,7 @@ class VoiceAgentConfig:
 
     # Logging
     log_level: str = field(
-        default_factory=lambda: os.getenv("LOG_LEVEL", "INFO")
+        default_factory=lambda: _env("LOG_LEVEL", default="INFO")
     )
 
     @property
@@ -77,13 +77,30 @@ class SessionManager:
         await session.stop()
     """
 
+    # Longest wait for response.done before the next agent sentence is sent
+    _RESPONSE_IDLE_TIMEOUT_S = 30.0
+
     def __init__(self, config: VoiceAgentConfig, tools: list | None = None) -> None:
         self._config = config
         self._voice_client = VoiceLiveClient(config)
         self._agent_client = FoundryAgentClient(config, tools=tools)
         self._context = ConversationContext()
         self._state = SessionState.IDLE
+        # Mirrors ``_state is SessionState.ACTIVE`` for the per-chunk audio path
+        self._active = False
+        # The agent service allows one active run per thread and a session owns a
+        # single thread, so turns are serialized, but outside the receive loop
         self._processing_lock = asyncio.Lock()
+        self._turn_tasks: set[asyncio.Task] = set()
+        # Set while Voice Live has no response in flight. Streamed agent
+        # sentences are sent one response at a time, since Voice Live rejects
+        # response.create while another response is active.
+        self._response_idle = asyncio.Event()
+        self._response_idle.set()
+        # event_id of the response.create the next sentence is waiting on
+        self._pending_response_id: str | None = None
+        # Set when the customer starts speaking; the current turn stops sending
+        self._barged_in = False
 
     @property
     def state(self) -> SessionState:
@@ -93,37 +110,59 @@ class SessionManager:
     def context(self) -> ConversationContext:
         return self._context
 
+    def _set_state(self, state: SessionState) -> None:
+        self._state = state
+        self._active = state is SessionState.ACTIVE
+
     async def start(self) -> None:
         """Initialize the session: connect Voice Live and create agent thread."""
-        self._state = SessionState.CONNECTING
+        self._set_state(SessionState.CONNECTING)
         logger.info("Starting voice agent session...")
 
-        # Initialize the agent (creates the agent in Foundry)
-        await self._agent_client.initialize()
-
-        # Create a conversation thread for this session
-        self._context.thread_id = self._agent_client.create_thread()
-
-        # Connect to Voice Live API
-        await self._voice_client.connect()
+        # Agent setup and the Voice Live handshake are independent network
+        # round trips, so run them concurrently
+        results = await asyncio.gather(
+            self._prepare_agent(),
+            self._voice_client.connect(),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            # Close whichever side did come up before reporting the failure
+            await self._voice_client.disconnect()
+            await self._agent_client.cleanup()
+            self._set_state(SessionState.DISCONNECTED)
+            raise errors[0]
+        self._context.thread_id = results[0]
 
         # Register event handlers for Voice Live events
-        self._voice_client.on(
-            "conversation.item.input_audio_transcription.completed",
-            self._on_transcription_completed,
-        )
-        self._voice_client.on("session.created", self._on_session_created)
-        self._voice_client.on("error", self._on_error)
+        self._voice_client.on_many({
+            "conversation.item.input_audio_transcription.completed": self._on_transcription_completed,
+            "session.created": self._on_session_created,
+            "response.done": self._on_response_done,
+            "input_audio_buffer.speech_started": self._on_speech_started,
+            "error": self._on_error,
+        })
 
-        self._state = SessionState.ACTIVE
+        self._set_state(SessionState.ACTIVE)
         logger.info("Voice agent session active (thread=%s)", self._context.thread_id)
 
+    async def _prepare_agent(self) -> str:
+        """Create the agent in Foundry and return a new conversation thread ID."""
+        await self._agent_client.initialize()
+        return await self._agent_client.create_thread()
+
     async def stop(self) -> None:
         """Gracefully shut down the session."""
         logger.info("Stopping voice agent session...")
+        turn_tasks = list(self._turn_tasks)
+        for task in turn_tasks:
+            task.cancel()
+        # Let cancelled turns unwind before the socket and the agent go away
+        await asyncio.gather(*turn_tasks, return_exceptions=True)
         await self._voice_client.disconnect()
         await self._agent_client.cleanup()
-        self._state = SessionState.DISCONNECTED
+        self._set_state(SessionState.DISCONNECTED)
         logger.info(
             "Session ended after %d turns", self._context.turn_count
         )
@@ -136,7 +175,7 @@ class SessionManager:
         - Voice activity detection (azure_semantic_vad)
         - Speech-to-text transcription
         """
-        if self._state != SessionState.ACTIVE:
+        if not self._active:
             logger.warning("Cannot send audio in state %s", self._state)
             return
         await self._voice_client.send_audio(audio_bytes)
@@ -147,7 +186,7 @@ class SessionManager:
         Useful for testing and demos where you want to simulate
         voice input without an actual microphone.
         """
-        if self._state != SessionState.ACTIVE:
+        if not self._active:
             logger.warning("Cannot send text in state %s", self._state)
             return
         await self._voice_client.send_text(text)
@@ -167,6 +206,9 @@ class SessionManager:
         1. Receive the transcribed text
         2. Send it to the Foundry Agent for processing
         3. Send the agent's response back to Voice Live for TTS
+
+        Steps 2 and 3 run in a separate task so the Voice Live receive loop
+        keeps dispatching events (e.g. barge-in) while the agent works.
         """
         transcript = event.get("transcript", "")
         if not transcript.strip():
@@ -175,25 +217,77 @@ class SessionManager:
         logger.info("Customer said: %s", transcript)
         self._context.add_turn("customer", transcript)
 
-        # Prevent concurrent processing (one utterance at a time)
-        async with self._processing_lock:
-            self._state = SessionState.PROCESSING
+        task = asyncio.create_task(self._run_agent_turn(transcript))
+        self._turn_tasks.add(task)
+        task.add_done_callback(self._turn_tasks.discard)
+
+    async def _run_agent_turn(self, transcript: str) -> None:
+        """Get the agent's answer to ``transcript`` and send it for TTS."""
+        try:
+            # One utterance at a time per agent thread
+            async with self._processing_lock:
+                self._set_state(SessionState.PROCESSING)
+                self._barged_in = False
+                try:
+                    # Send transcript to the Foundry Agent
+                    # The agent will classify intent, call tools, and formulate a response.
+                    # The first sentence goes to Voice Live TTS as soon as it is
+                    # complete; the rest of the reply follows as one item and one
+                    # response, so a reply costs at most two Voice Live responses.
+                    sentences = []
+                    async for sentence in self._agent_client.stream_message(
+                        self._context.thread_id, transcript
+                    ):
+                        sentences.append(sentence)
+                        if len(sentences) == 1:
+                            await self._speak(sentence)
+
+                    remainder = " ".join(sentences[1:])
+                    if remainder:
+                        await self._speak(remainder)
+
+                    response = " ".join(sentences)
+                    self._context.add_turn("agent", response)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Agent response: %s", response[:100])
+                finally:
+                    # A failed turn must not leave the session dropping audio
+                    if self._state is SessionState.PROCESSING:
+                        self._set_state(SessionState.ACTIVE)
+        except Exception:
+            logger.exception("Agent turn failed")
+
+    async def _speak(self, text: str) -> None:
+        """Send ``text`` for TTS once Voice Live is idle, unless the customer barged in."""
+        await self._wait_response_idle()
+        if self._barged_in:
+            logger.info("Customer interrupted; not speaking the rest of the reply")
+            return
+        self._response_idle.clear()
+        self._pending_response_id = await self._voice_client.send_agent_response(text)
 
-            # Send transcript to the Foundry Agent
-            # The agent will classify intent, call tools, and formulate a response
-            response = await asyncio.to_thread(
-                self._agent_client.process_message,
-                self._context.thread_id,
-                transcript,
-            )
+    async def _wait_response_idle(self) -> None:
+        """Wait until Voice Live has no response in flight, at most _RESPONSE_IDLE_TIMEOUT_S.
 
-            self._context.add_turn("agent", response)
-            logger.info("Agent response: %s", response[:100])
+        The bound keeps a turn (and every turn queued behind the lock) from
+        hanging when response.done never arrives, e.g. after the socket dropped.
+        """
+        try:
+            await asyncio.wait_for(self._response_idle.wait(), self._RESPONSE_IDLE_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "No response.done after %.0fs; sending the next sentence anyway",
+                self._RESPONSE_IDLE_TIMEOUT_S,
+            )
 
-            # Send the agent's text response to Voice Live for TTS
-            await self._voice_client.send_agent_response(response)
+    async def _on_response_done(self, event: dict) -> None:
+        """Handle response.done: the next agent sentence may be spoken."""
+        self._pending_response_id = None
+        self._response_idle.set()
 
-            self._state = SessionState.ACTIVE
+    async def _on_speech_started(self, event: dict) -> None:
+        """Handle barge-in: Voice Live cancels its response, the turn stops sending."""
+        self._barged_in = True
 
     async def _on_error(self, event: dict) -> None:
         """Handle errors from Voice Live."""
@@ -203,3 +297,10 @@ class SessionManager:
             error.get("code"),
             error.get("message"),
         )
+        # A rejected response.create never produces response.done; release the
+        # next sentence only for that error, not for unrelated ones while the
+        # current response is still being spoken
+        pending = self._pending_response_id
+        if pending is not None and error.get("event_id") == pending:
+            self._pending_response_id = None
+            self._response_idle.set()
@@ -12,19 +12,31 @@ Docs:
 - Quickstart: https://learn.microsoft.com/en-us/azure/ai-services/speech-service/voice-live-quickstart
 - API Reference: https://learn.microsoft.com/en-us/azure/ai-services/speech-service/voice-live-api-reference
 - How-To: https://learn.microsoft.com/en-us/azure/ai-services/speech-service/voice-live-how-to
+
+Audio sending: do not wrap ``send_audio`` in ``asyncio.create_task`` per chunk.
+Audio is queued and sent by a single writer task, so producers (e.g. audio
+callbacks) should call ``send_audio_nowait`` directly, or ``await send_audio``.
+
+Event loop: on Linux/macOS, start the program with ``event_loop_runner()(main())``
+to run the receive and writer loops on libuv (``pip install uvloop``).
 """
 
 from __future__ import annotations
 
 import asyncio
-import base64
-import json
+import itertools
 import logging
-from typing import Callable, Awaitable
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Coroutine
 
+from azure.identity import DefaultAzureCredential
 import websockets
 from websockets.asyncio.client import ClientConnection
 
+from .codec import b64decode, b64encode_str, json_dumps, json_loads
 from .config import VoiceAgentConfig
 
 logger = logging.getLogger(__name__)
@@ -32,6 +44,82 @@ logger = logging.getLogger(__name__)
 # Type alias for event handler callbacks
 EventHandler = Callable[[dict], Awaitable[None]]
 
+_TOKEN_SCOPE = "https://cognitiveservices.azure.com/.default"
+# Refresh cached tokens this many seconds before they expire
+_TOKEN_REFRESH_MARGIN_S = 60
+
+# Shared across clients so reconnects skip the DefaultAzureCredential probe
+_credential = None
+_token_cache: dict[str, tuple[str, float]] = {}
+_credential_lock = threading.Lock()
+
+
+def _get_bearer_token(scope: str) -> str:
+    """Return a cached bearer token for ``scope``, fetching a new one near expiry."""
+    global _credential
+    with _credential_lock:
+        cached = _token_cache.get(scope)
+        if cached and time.time() + _TOKEN_REFRESH_MARGIN_S < cached[1]:
+            return cached[0]
+        if _credential is None:
+            _credential = DefaultAzureCredential()
+        token = _credential.get_token(scope)
+        _token_cache[scope] = (token.token, token.expires_on)
+        return token.token
+
+
+def event_loop_runner() -> Callable[[Coroutine[Any, Any, Any]], Any]:
+    """Return the entry point that runs ``main()``: ``uvloop.run`` if installed, else ``asyncio.run``.
+
+    Usage: ``event_loop_runner()(main())``. No global event loop policy is set.
+    """
+    try:
+        from uvloop import run
+    except ImportError:
+        logger.debug("uvloop not installed; using the default asyncio event loop")
+        return asyncio.run
+    return run
+
+
+_NO_HANDLERS: tuple[EventHandler, ...] = ()
+
+_AUDIO_DELTA_TYPE = "response.audio.delta"
+_AUDIO_DELTA_MARKER = '"type":"response.audio.delta"'
+_DELTA_FIELD = '"delta":"'
+_AUDIO_DELTA_MARKER_B = _AUDIO_DELTA_MARKER.encode()
+_DELTA_FIELD_B = _DELTA_FIELD.encode()
+
+
+def _extract_audio_delta(message: str | bytes) -> bytes | None:
+    """Decode the PCM payload of a ``response.audio.delta`` message without JSON parsing.
+
+    Accepts the frame as ``str`` or as undecoded UTF-8 ``bytes``; for bytes the
+    base64 payload is decoded through a memoryview, without slicing a copy.
+    Returns None if the message is not a (compactly serialized) audio delta,
+    in which case the caller falls back to a regular JSON parse.
+    """
+    if isinstance(message, str):
+        if _AUDIO_DELTA_MARKER not in message:
+            return None
+        start = message.find(_DELTA_FIELD)
+        if start < 0:
+            return None
+        start += len(_DELTA_FIELD)
+        end = message.find('"', start)
+        if end < 0:
+            return None
+        return b64decode(message[start:end])
+    if _AUDIO_DELTA_MARKER_B not in message:
+        return None
+    start = message.find(_DELTA_FIELD_B)
+    if start < 0:
+        return None
+    start += len(_DELTA_FIELD_B)
+    end = message.find(b'"', start)
+    if end < 0:
+        return None
+    return b64decode(memoryview(message)[start:end])
+
 
 class VoiceLiveClient:
     """Async WebSocket client for the Azure Voice Live API.
@@ -48,11 +136,76 @@ class VoiceLiveClient:
             await client.send_audio(audio_chunk)
     """
 
-    def __init__(self, config: VoiceAgentConfig) -> None:
+    __slots__ = (
+        "_config",
+        "_api_key",
+        "_ws",
+        "_handlers",
+        "_handlers_frozen",
+        "_receive_task",
+        "_decode_audio_deltas",
+        "_send_queue",
+        "_queued_bytes",
+        "_send_waker",
+        "_coalesce_buf",
+        "_writer_task",
+        "_writer_error",
+        "_response_ids",
+    )
+
+    # Fixed JSON envelope for audio appends. Base64 output is always JSON-safe,
+    # so the payload can be spliced in without running it through json.dumps.
+    _AUDIO_APPEND_PREFIX = '{"type":"input_audio_buffer.append","audio":"'
+    _AUDIO_APPEND_SUFFIX = '"}'
+
+    # Largest accepted server message; long TTS audio deltas can exceed the 1 MiB default
+    _MAX_MESSAGE_BYTES = 2**24
+
+    # Payload-free control events, serialized once
+    _COMMIT_EVENT = '{"type":"input_audio_buffer.commit"}'
+    # response.create with a client event_id, which Voice Live echoes in error.event_id
+    _RESPONSE_CREATE_TEMPLATE = '{"type":"response.create","event_id":"%s"}'
+
+    # Upper bound for audio coalesced into one append (200 ms of 24 kHz PCM16)
+    _MAX_COALESCED_AUDIO_BYTES = 9600
+    # Upper bound for queued, unsent audio (5 s of 24 kHz PCM16); when a stalled
+    # socket lets it fill up, the oldest audio is dropped
+    _MAX_QUEUED_AUDIO_BYTES = 240_000
+
+    def __init__(
+        self,
+        config: VoiceAgentConfig,
+        *,
+        decode_audio_deltas: bool = False,
+    ) -> None:
+        """Create the client.
+
+        Args:
+            config: Voice agent configuration.
+            decode_audio_deltas: If True, ``response.audio.delta`` events skip
+                JSON parsing and handlers receive
+                ``{"type": "response.audio.delta", "audio": <PCM bytes>}``.
+        """
         self._config = config
+        # Read once per client, like VoiceAgentConfig reads its environment
+        self._api_key = os.getenv("AZURE_VOICELIVE_API_KEY") or os.getenv("AZURE_API_KEY")
         self._ws: ClientConnection | None = None
         self._handlers: dict[str, list[EventHandler]] = {}
+        # Immutable snapshot of _handlers read by _dispatch; rebuilt on registration
+        self._handlers_frozen: dict[str, tuple[EventHandler, ...]] = {}
         self._receive_task: asyncio.Task | None = None
+        self._decode_audio_deltas = decode_audio_deltas
+
+        # Outgoing audio: send_audio enqueues, a single writer task drains
+        self._send_queue: deque[bytes] = deque()
+        self._queued_bytes = 0
+        self._send_waker = asyncio.Event()
+        # Reused staging buffer for coalesced PCM (encoded before any await)
+        self._coalesce_buf = bytearray(self._MAX_COALESCED_AUDIO_BYTES)
+        self._writer_task: asyncio.Task | None = None
+        # Why the writer stopped; re-raised to producers by send_audio_nowait
+        self._writer_error: BaseException | None = None
+        self._response_ids = itertools.count(1)
 
     # -- Lifecycle ---------------------------------------------------------
 
@@ -62,19 +215,36 @@ class VoiceLiveClient:
         logger.info("Connecting to Voice Live API: %s", url)
 
         # Connect with Azure API key or token header
-        self._ws = await websockets.connect(url, additional_headers=self._auth_headers())
+        # permessage-deflate is off: base64 PCM barely compresses, so zlib on
+        # every frame only costs CPU and latency in both directions
+        self._ws = await websockets.connect(
+            url,
+            additional_headers=self._auth_headers(),
+            compression=None,
+            max_size=self._MAX_MESSAGE_BYTES,
+        )
 
         # Start background receiver loop
         self._receive_task = asyncio.create_task(self._receive_loop())
 
         # Send initial session configuration
-        await self._send_event("session.update", {
-            "session": self._config.voice.to_session_config()
+        await self._send_json({
+            "type": "session.update",
+            "session": self._config.voice.session_config,
         })
         logger.info("Voice Live session configured (voice=%s)", self._config.voice.voice_name)
 
+        # Start the audio writer after session.update so audio never precedes it
+        self._writer_error = None
+        self._writer_task = asyncio.create_task(self._writer_loop())
+
     async def disconnect(self) -> None:
         """Close the WebSocket connection gracefully."""
+        if self._writer_task:
+            self._writer_task.cancel()
+            self._writer_task = None
+        self._send_queue.clear()
+        self._queued_bytes = 0
         if self._receive_task:
             self._receive_task.cancel()
             self._receive_task = None
@@ -95,43 +265,74 @@ class VoiceLiveClient:
     async def send_audio(self, audio_bytes: bytes) -> None:
         """Stream a chunk of PCM16 audio to Voice Live for processing.
 
-        The audio is base64-encoded and sent as an input_audio_buffer.append event.
-        Voice Live handles VAD, noise suppression, and STT automatically.
+        The chunk is queued for the background writer, which base64-encodes
+        whatever has accumulated and sends it as one input_audio_buffer.append
+        event. Voice Live handles VAD, noise suppression, and STT automatically.
         """
-        encoded = base64.b64encode(audio_bytes).decode("ascii")
-        await self._send_event("input_audio_buffer.append", {
-            "audio": encoded,
-        })
+        self.send_audio_nowait(audio_bytes)
+
+    def send_audio_nowait(self, audio_bytes: bytes) -> None:
+        """Queue a chunk of PCM16 audio without awaiting (must run on the event loop thread).
+
+        Use this from producers instead of ``asyncio.create_task(client.send_audio(...))``.
+
+        Raises:
+            RuntimeError: If the client is not connected.
+            websockets.ConnectionClosed: If the connection dropped (the writer's
+                error is re-raised as is).
+        """
+        if self._ws is None:
+            raise RuntimeError("Not connected")
+        writer = self._writer_task
+        if writer is not None and writer.done():
+            raise self._writer_error or RuntimeError("Audio writer stopped")
+        queue = self._send_queue
+        queue.append(audio_bytes)
+        self._queued_bytes += len(audio_bytes)
+        while self._queued_bytes > self._MAX_QUEUED_AUDIO_BYTES and len(queue) > 1:
+            self._queued_bytes -= len(queue.popleft())
+        self._send_waker.set()
 
     async def send_text(self, text: str) -> None:
         """Send a text message to be processed by the agent (bypass STT)."""
-        await self._send_event("conversation.item.create", {
+        await self._send_json({
+            "type": "conversation.item.create",
             "item": {
                 "type": "message",
                 "role": "user",
                 "content": [{"type": "input_text", "text": text}],
-            }
+            },
         })
 
-    async def send_agent_response(self, text: str) -> None:
+    async def send_agent_response(self, text: str) -> str:
         """Inject the agent's text response for TTS rendering.
 
         After the Foundry Agent produces a text reply, send it here
         so Voice Live converts it to speech audio.
+
+        Returns:
+            The ``event_id`` of the ``response.create`` request, so an
+            ``error`` event rejecting it can be told apart from others.
         """
-        await self._send_event("conversation.item.create", {
+        await self._send_json({
+            "type": "conversation.item.create",
             "item": {
                 "type": "message",
                 "role": "assistant",
                 "content": [{"type": "text", "text": text}],
-            }
+            },
         })
         # Trigger TTS generation
-        await self._send_event("response.create", {})
+        event_id = f"agent_response_{next(self._response_ids)}"
+        await self._require_ws().send(self._RESPONSE_CREATE_TEMPLATE % event_id)
+        return event_id
 
     async def commit_audio_buffer(self) -> None:
         """Signal that the current audio buffer is complete (end of utterance)."""
-        await self._send_event("input_audio_buffer.commit", {})
+        # Queued audio must reach the server before the commit
+        while self._send_queue:
+            await self._send_queued_audio()
+        await self._require_ws().send(self._COMMIT_EVENT)
 
     # -- Event handling ----------------------------------------------------
 
@@ -146,18 +347,52 @@ class VoiceLiveClient:
         - error
         """
         self._handlers.setdefault(event_type, []).append(handler)
+        self._freeze_handlers()
+
+    def on_many(self, handlers: dict[str, EventHandler]) -> None:
+        """Register several event handlers in one call.
+
+        Equivalent to calling :meth:`on` for each ``event_type -> handler`` pair.
+        """
+        registry = self._handlers
+        for event_type, handler in handlers.items():
+            registry.setdefault(event_type, []).append(handler)
+        self._freeze_handlers()
+
+    def _freeze_handlers(self) -> None:
+        self._handlers_frozen = {
+            event_type: tuple(handlers) for event_type, handlers in self._handlers.items()
+        }
 
     # -- Receiving (internal) ----------------------------------------------
 
     async def _receive_loop(self) -> None:
         """Background loop that reads events from the WebSocket."""
-        assert self._ws is not None
+        ws = self._require_ws()
+        # recv() returns already-buffered messages without suspending, so a
+        # burst of frames is drained back to back; dispatch stays sequential
+        # because audio deltas must reach handlers in order.
+        recv = ws.recv
+        dispatch = self._dispatch
+        decode_audio_deltas = self._decode_audio_deltas
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
-            async for message in self._ws:
-                event = json.loads(message)
+            while True:
+                # decode=False hands text frames over as the received UTF-8 bytes:
+                # no str copy, and both parsers below accept bytes directly
+                message = await recv(decode=False)
+                if decode_audio_deltas:
+                    audio = _extract_audio_delta(message)
+                    if audio is not None:
+                        await dispatch(
+                            _AUDIO_DELTA_TYPE, {"type": _AUDIO_DELTA_TYPE, "audio": audio}
+                        )
+                        continue
+                event = json_loads(message)
                 event_type = event.get("type", "unknown")
-                logger.debug("Voice Live event: %s", event_type)
-                await self._dispatch(event_type, event)
+                if debug:
+                    logger.debug("Voice Live event: %s", event_type)
+                await dispatch(event_type, event)
         except websockets.ConnectionClosed:
             logger.info("Voice Live WebSocket connection closed")
         except asyncio.CancelledError:
@@ -165,34 +400,85 @@ class VoiceLiveClient:
 
     async def _dispatch(self, event_type: str, event: dict) -> None:
         """Dispatch an event to all registered handlers."""
-        for handler in self._handlers.get(event_type, []):
+        handlers = self._handlers_frozen.get(event_type, _NO_HANDLERS)
+        if not handlers:
+            return
+        for handler in handlers:
             try:
                 await handler(event)
             except Exception:
                 logger.exception("Error in handler for event '%s'", event_type)
 
+    # -- Audio writer (internal) -------------------------------------------
+
+    async def _writer_loop(self) -> None:
+        """Background loop that sends queued audio, coalescing chunks that piled up."""
+        try:
+            while True:
+                await self._send_waker.wait()
+                self._send_waker.clear()
+                while self._send_queue:
+                    await self._send_queued_audio()
+        except asyncio.CancelledError:
+            pass
+        except websockets.ConnectionClosed as exc:
+            self._writer_error = exc
+            logger.info("Voice Live WebSocket closed; audio writer stopped")
+        except Exception as exc:  # e.g. RuntimeError from _require_ws after disconnect
+            self._writer_error = exc
+            logger.exception("Voice Live audio writer failed")
+        finally:
+            # Nothing will send the backlog any more
+            self._send_queue.clear()
+            self._queued_bytes = 0
+
+    async def _send_queued_audio(self) -> None:
+        """Pop up to _MAX_COALESCED_AUDIO_BYTES of queued audio and send it as one append."""
+        ws = self._require_ws()
+        queue = self._send_queue
+        limit = self._MAX_COALESCED_AUDIO_BYTES
+        chunk = queue.popleft()
+        payload: bytes | memoryview = chunk
+        if queue and len(chunk) + len(queue[0]) <= limit:
+            # Copy the batch into the preallocated buffer instead of joining
+            view = memoryview(self._coalesce_buf)
+            size = len(chunk)
+            view[:size] = chunk
+            while queue and size + len(queue[0]) <= limit:
+                nxt = queue.popleft()
+                view[size:size + len(nxt)] = nxt
+                size += len(nxt)
+            payload = view[:size]
+        self._queued_bytes -= len(payload)
+        # Encode synchronously so the staging buffer is free again before the await
+        await ws.send(
+            f"{self._AUDIO_APPEND_PREFIX}{b64encode_str(payload)}{self._AUDIO_APPEND_SUFFIX}"
+        )
+
     # -- Helpers -----------------------------------------------------------
 
-    async def _send_event(self, event_type: str, payload: dict) -> None:
-        """Serialize and send a JSON event over the WebSocket."""
-        assert self._ws is not None, "Not connected"
-        message = {"type": event_type, **payload}
-        await self._ws.send(json.dumps(message))
-        logger.debug("Sent event: %s", event_type)
+    def _require_ws(self) -> ClientConnection:
+        """Return the open WebSocket or raise if the client is not connected."""
+        ws = self._ws
+        if ws is None:
+            raise RuntimeError("Not connected")
+        return ws
+
+    async def _send_json(self, message: dict) -> None:
+        """Serialize and send a complete JSON event (including "type") over the WebSocket."""
+        ws = self._require_ws()
+        await ws.send(json_dumps(message))
+        logger.debug("Sent event: %s", message["type"])
 
     def _auth_headers(self) -> dict[str, str]:
         """Build authentication headers for the WebSocket handshake.
 
         Uses API key if AZURE_VOICELIVE_API_KEY is set, otherwise falls back
-        to DefaultAzureCredential bearer token.
+        to a DefaultAzureCredential bearer token shared across connects.
         """
-        import os
-        api_key = os.getenv("AZURE_VOICELIVE_API_KEY") or os.getenv("AZURE_API_KEY")
+        api_key = self._api_key
         if api_key:
             return {"api-key": api_key}
 
-        # Use Azure Identity for token-based auth
-        from azure.identity import DefaultAzureCredential
-        credential = DefaultAzureCredential()
-        token = credential.get_token("https://cognitiveservices.azure.com/.default")
-        return {"Authorization": f"Bearer {token.token}"}
+        # Use Azure Identity for token-based auth (credential and token are cached)
+        return {"Authorization": f"Bearer {_get_bearer_token(_TOKEN_SCOPE)}"}
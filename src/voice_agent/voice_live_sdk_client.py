@@ -12,10 +12,10 @@ Docs:
 
 from __future__ import annotations
 
-import asyncio
-import base64
 import logging
+import sys
 from collections.abc import AsyncIterator
+from typing import Any, Awaitable, Callable
 
 from azure.ai.voicelive.aio import connect
 from azure.ai.voicelive.models import (
@@ -32,10 +32,15 @@ from azure.ai.voicelive.models import (
 )
 from azure.identity.aio import DefaultAzureCredential
 
-from .config import VoiceAgentConfig
+from .codec import b64encode_str
+from .config import VoiceAgentConfig, VoiceLiveConfig
+
+__all__ = ["SDKEventHandler", "VoiceLiveSDKClient"]
 
 logger = logging.getLogger(__name__)
 
+SDKEventHandler = Callable[[Any], Awaitable[None]]
+
 
 class VoiceLiveSDKClient:
     """Voice Live client using the official Azure SDK.
@@ -58,14 +63,32 @@ class VoiceLiveSDKClient:
             # Process events
             async for event in client.events():
                 if event.type == ServerEventType.RESPONSE_AUDIO_DELTA:
-                    play_audio(base64.b64decode(event.delta))
+                    play_audio(event.delta)
+
+    Or register handlers and let the client route events by type::
+
+        client.on(ServerEventType.RESPONSE_AUDIO_DELTA, handle_audio)
+        await client.dispatch_events()
     """
 
+    __slots__ = (
+        "_config",
+        "_connection",
+        "_ctx_manager",
+        "_credential",
+        "_dispatch_table",
+        "_session_cache",
+    )
+
     def __init__(self, config: VoiceAgentConfig) -> None:
         self._config = config
         self._connection = None
         self._ctx_manager = None
         self._credential = DefaultAzureCredential()
+        # Interned event-type string -> handlers, so dispatch is one dict lookup
+        self._dispatch_table: dict[str, tuple[SDKEventHandler, ...]] = {}
+        # (voice config, RequestSession) reused across reconnects
+        self._session_cache: tuple[VoiceLiveConfig, RequestSession] | None = None
 
     async def connect(self) -> None:
         """Open the Voice Live connection using the SDK.
@@ -84,14 +107,29 @@ class VoiceLiveSDKClient:
             endpoint=endpoint,
             credential=self._credential,
             model=model,
+            # No per-message deflate: base64 audio is near-incompressible
+            connection_options={"compression": False, "max_msg_size": 2**24},
         )
         self._connection = await self._ctx_manager.__aenter__()
 
+        await self._connection.session.update(session=self._session_config())
+        logger.info("Voice Live session configured (voice=%s)", self._config.voice.voice_name)
+
+    def _session_config(self) -> RequestSession:
+        """Return the session config, building the SDK models once per VoiceLiveConfig.
+
+        VoiceLiveConfig is frozen, so the cached RequestSession stays valid
+        for as long as the client holds the same voice config object.
+        """
+        voice_cfg = self._config.voice
+        cached = self._session_cache
+        if cached is not None and cached[0] is voice_cfg:
+            return cached[1]
+
         # Configure the session with voice, VAD, noise suppression, and echo cancellation.
         # AzureSemanticVad is the recommended VAD for conversational agents --
         # it understands language structure and avoids cutting off mid-sentence pauses.
         # Docs: https://learn.microsoft.com/en-us/azure/ai-services/speech-service/voice-live-how-to
-        voice_cfg = self._config.voice
         session_config = RequestSession(
             modalities=[Modality.TEXT, Modality.AUDIO],
             voice=AzureStandardVoice(
@@ -113,9 +151,8 @@ class VoiceLiveSDKClient:
             ),
             input_audio_echo_cancellation=AudioEchoCancellation(),
         )
-
-        await self._connection.session.update(session=session_config)
-        logger.info("Voice Live session configured (voice=%s)", voice_cfg.voice_name)
+        self._session_cache = (voice_cfg, session_config)
+        return session_config
 
     async def disconnect(self) -> None:
         """Close the Voice Live connection."""
@@ -138,20 +175,17 @@ class VoiceLiveSDKClient:
 
         The SDK's input_audio_buffer.append() accepts base64-encoded audio.
         """
-        assert self._connection is not None, "Not connected"
-        encoded = base64.b64encode(audio_bytes).decode("utf-8")
-        await self._connection.input_audio_buffer.append(audio=encoded)
+        await self._require_connection().input_audio_buffer.append(audio=b64encode_str(audio_bytes))
 
     async def create_response(self) -> None:
         """Trigger a response from the agent (e.g., for a proactive greeting)."""
-        assert self._connection is not None, "Not connected"
-        await self._connection.response.create()
+        await self._require_connection().response.create()
 
     async def cancel_response(self) -> None:
         """Cancel the current response (e.g., on barge-in when the user starts speaking)."""
-        assert self._connection is not None, "Not connected"
+        connection = self._require_connection()
         try:
-            await self._connection.response.cancel()
+            await connection.response.cancel()
         except Exception as e:
             if "no active response" in str(e).lower():
                 logger.debug("Cancel ignored -- no active response")
@@ -172,6 +206,35 @@ class VoiceLiveSDKClient:
         - ServerEventType.RESPONSE_DONE
         - ServerEventType.ERROR
         """
-        assert self._connection is not None, "Not connected"
-        async for event in self._connection:
+        async for event in self._require_connection():
             yield event
+
+    def on(self, event_type: ServerEventType | str, handler: SDKEventHandler) -> None:
+        """Register an async handler for a server event type used by dispatch_events()."""
+        key = sys.intern(str(getattr(event_type, "value", event_type)))
+        self._dispatch_table[key] = self._dispatch_table.get(key, ()) + (handler,)
+
+    async def dispatch_events(self) -> None:
+        """Read server events and route each one to the handlers registered via on().
+
+        Event types are looked up by their string value, so there is no Enum
+        comparison chain per event.
+        """
+        table = self._dispatch_table
+        async for event in self._require_connection():
+            event_type = event.type
+            handlers = table.get(getattr(event_type, "value", event_type))
+            if not handlers:
+                continue
+            for handler in handlers:
+                try:
+                    await handler(event)
+                except Exception:
+                    logger.exception("Error in handler for event '%s'", event_type)
+
+    def _require_connection(self):
+        """Return the open SDK connection or raise if the client is not connected."""
+        connection = self._connection
+        if connection is None:
+            raise RuntimeError("Not connected")
+        return connection
@@ -0,0 +1,172 @@
+"""Tests for the Foundry Agent Service client."""
+
+import os
+from types import SimpleNamespace
+from unittest import mock
+
+from azure.ai.agents.models import (
+    AgentStreamEvent,
+    ListSortOrder,
+    MessageDeltaChunk,
+    MessageRole,
+    TruncationStrategy,
+)
+
+from src.voice_agent import agent_client
+from src.voice_agent.agent_client import FoundryAgentClient
+from src.voice_agent.config import VoiceAgentConfig
+
+_ENV = {
+    "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+    "PROJECT_NAME": "my-project",
+}
+
+
+class _FakeMessages:
+    def __init__(self, newest):
+        self._newest = newest
+        self.create = mock.AsyncMock()
+        self.list_kwargs = None
+
+    def list(self, **kwargs):
+        self.list_kwargs = kwargs
+        return self._iterate()
+
+    async def _iterate(self):
+        yield self._newest
+
+
+def _agent_message(text):
+    return SimpleNamespace(
+        role=MessageRole.AGENT,
+        text_messages=[SimpleNamespace(text=SimpleNamespace(value=text))],
+    )
+
+
+class TestProcessMessage:
+    @mock.patch.dict(os.environ, _ENV)
+    async def test_fetches_only_the_newest_message_of_the_run(self):
+        client = FoundryAgentClient(VoiceAgentConfig())
+        messages = _FakeMessages(_agent_message("Ihre Bestellung ist unterwegs."))
+        run = SimpleNamespace(id="run_1", status="completed")
+        runs = SimpleNamespace(create_and_process=mock.AsyncMock(return_value=run))
+        client._client = SimpleNamespace(messages=messages, runs=runs)
+        client._agent = SimpleNamespace(id="asst_1")
+
+        response = await client.process_message("thread_1", "Wo ist meine Bestellung?")
+
+        assert response == "Ihre Bestellung ist unterwegs."
+        assert messages.list_kwargs == {
+            "thread_id": "thread_1",
+            "run_id": "run_1",
+            "order": ListSortOrder.DESCENDING,
+            "limit": 1,
+        }
+        truncation = runs.create_and_process.await_args.kwargs["truncation_strategy"]
+        assert truncation.type == TruncationStrategy.LAST_MESSAGES
+
+
+class _FakeStream:
+    def __init__(self, events):
+        self._events = events
+
+    async def __aenter__(self):
+        return self._iterate()
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def _iterate(self):
+        for event in self._events:
+            yield event
+
+
+def _delta(text):
+    chunk = MessageDeltaChunk(
+        id="msg_1",
+        delta={"role": "assistant", "content": [
+            {"index": 0, "type": "text", "text": {"value": text}},
+        ]},
+    )
+    return (AgentStreamEvent.THREAD_MESSAGE_DELTA, chunk, None)
+
+
+class TestStreamMessage:
+    @mock.patch.dict(os.environ, _ENV)
+    async def test_yields_complete_sentences_as_they_arrive(self):
+        client = FoundryAgentClient(VoiceAgentConfig())
+        stream = _FakeStream([
+            _delta("Ihre Bestellung ist unter"),
+            _delta("wegs. Sie kommt "),
+            _delta("morgen an!"),
+        ])
+        client._client = SimpleNamespace(
+            messages=_FakeMessages(None),
+            runs=SimpleNamespace(stream=mock.AsyncMock(return_value=stream)),
+        )
+        client._agent = SimpleNamespace(id="asst_1")
+
+        sentences = [s async for s in client.stream_message("thread_1", "Wo ist meine Bestellung?")]
+
+        assert sentences == ["Ihre Bestellung ist unterwegs.", "Sie kommt morgen an!"]
+
+
+class TestSplitSentences:
+    def test_does_not_split_after_ordinals(self):
+        sentences, rest = agent_client._split_sentences(
+            "Die Lieferung kommt am 3. Januar an. Danke"
+        )
+        assert sentences == ["Die Lieferung kommt am 3. Januar an."]
+        assert rest == "Danke"
+
+    def test_does_not_split_after_single_letter_abbreviations(self):
+        sentences, rest = agent_client._split_sentences(
+            "Sie können z. B. per Karte zahlen. Oder"
+        )
+        assert sentences == ["Sie können z. B. per Karte zahlen."]
+        assert rest == "Oder"
+
+    def test_keeps_short_fragments_with_the_following_text(self):
+        sentences, rest = agent_client._split_sentences("Ja. Ihre Bestellung ist unterwegs. Sie")
+        assert sentences == ["Ja. Ihre Bestellung ist unterwegs."]
+        assert rest == "Sie"
+
+
+class TestSharedCredential:
+    @mock.patch.dict(os.environ, _ENV)
+    async def test_clients_share_one_credential_across_cleanup(self, monkeypatch):
+        credential_cls = mock.Mock(return_value=mock.Mock(close=mock.AsyncMock()))
+        sdk_clients = []
+
+        def make_sdk_client(**kwargs):
+            sdk_client = mock.Mock(
+                create_agent=mock.AsyncMock(return_value=SimpleNamespace(id="asst_1")),
+                delete_agent=mock.AsyncMock(),
+                close=mock.AsyncMock(),
+                credential=kwargs["credential"],
+            )
+            sdk_clients.append(sdk_client)
+            return sdk_client
+
+        monkeypatch.setattr(agent_client, "_credential", None)
+        monkeypatch.setattr(agent_client, "DefaultAzureCredential", credential_cls)
+        monkeypatch.setattr(agent_client, "AgentsClient", make_sdk_client)
+
+        for _ in range(2):
+            client = FoundryAgentClient(VoiceAgentConfig())
+            await client.initialize()
+            await client.cleanup()
+
+        credential_cls.assert_called_once()
+        assert sdk_clients[0].credential is sdk_clients[1].credential
+        credential_cls.return_value.close.assert_not_awaited()
+
+    async def test_close_credential_releases_the_shared_credential(self, monkeypatch):
+        credential = mock.Mock(close=mock.AsyncMock())
+        monkeypatch.setattr(agent_client, "_credential", credential)
+
+        await agent_client.close_credential()
+        await agent_client.close_credential()
+
+        credential.close.assert_awaited_once()
+        assert agent_client._credential is None
@@ -0,0 +1,28 @@
+"""Tests for the base64/JSON codec helpers."""
+
+import base64
+
+from src.voice_agent.codec import b64encode, b64encode_str, json_dumps, json_loads
+
+
+class TestCodec:
+    def test_encode_matches_stdlib(self):
+        chunk = bytes(range(256)) * 10
+        expected = base64.b64encode(chunk)
+        assert b64encode(chunk) == expected
+        assert b64encode_str(chunk) == expected.decode("ascii")
+
+    def test_encode_empty(self):
+        assert b64encode(b"") == b""
+        assert b64encode_str(b"") == ""
+
+
+class TestJson:
+    def test_round_trip(self):
+        event = {"type": "session.update", "session": {"voice": {"name": "de-DE-ConradNeural"}}}
+        encoded = json_dumps(event)
+        assert isinstance(encoded, str)
+        assert json_loads(encoded) == event
+
+    def test_non_ascii(self):
+        assert json_loads(json_dumps({"text": "Grüß Gott"})) == {"text": "Grüß Gott"}
@@ -46,6 +46,12 @@ class TestVoiceLiveConfig:
         assert session["turn_detection"]["threshold"] == 0.8
         assert session["turn_detection"]["silence_duration_ms"] == 300
 
+    def test_session_config_is_cached(self):
+        config = VoiceLiveConfig()
+        assert config.to_session_config() is config.session_config
+        with pytest.raises(AttributeError):
+            config.voice_name = "en-US-JennyNeural"
+
 
 class TestVoiceAgentConfig:
     """Tests for the top-level voice agent configuration."""
@@ -83,6 +89,18 @@ class TestVoiceAgentConfig:
         assert "api-version=" in url
         assert "model=gpt-4.1" in url
 
+    @mock.patch.dict(os.environ, {
+        "AZURE_FOUNDRY_ENDPOINT": "",
+        "AZURE_VOICELIVE_ENDPOINT": "https://fallback.services.ai.azure.com",
+        "PROJECT_NAME": "my-project",
+        "AZURE_VOICELIVE_MODEL": "",
+        "VOICE_LIVE_MODEL": "gpt-4o-realtime",
+    })
+    def test_env_fallback_chain(self):
+        config = VoiceAgentConfig()
+        assert config.endpoint == "https://fallback.services.ai.azure.com"
+        assert config.voice_live_model == "gpt-4o-realtime"
+
     def test_missing_endpoint_raises(self):
         with mock.patch.dict(os.environ, {}, clear=True):
             with pytest.raises(KeyError):
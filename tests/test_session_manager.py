@@ -1,6 +1,14 @@
 """Tests for the SessionManager conversation context."""
 
-from src.voice_agent.session_manager import ConversationContext, SessionState
+import asyncio
+import os
+from dataclasses import asdict
+from unittest import mock
+
+import pytest
+
+from src.voice_agent.config import VoiceAgentConfig
+from src.voice_agent.session_manager import ConversationContext, SessionManager, SessionState
 
 
 class TestConversationContext:
@@ -23,6 +31,14 @@ class TestConversationContext:
         assert ctx.transcript_history[0]["turn"] == 1
         assert ctx.transcript_history[1]["turn"] == 2
 
+    def test_transcript_history_is_a_dataclass_field(self):
+        ctx = ConversationContext()
+        ctx.add_turn("customer", "Hallo")
+
+        assert asdict(ctx)["transcript_history"] == [
+            {"turn": 1, "role": "customer", "text": "Hallo"}
+        ]
+
 
 class TestSessionState:
     def test_states_exist(self):
@@ -31,3 +47,266 @@ class TestSessionState:
         assert SessionState.ACTIVE.value == "active"
         assert SessionState.PROCESSING.value == "processing"
         assert SessionState.DISCONNECTED.value == "disconnected"
+
+
+class TestSessionManagerState:
+    @mock.patch.dict(os.environ, {
+        "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+        "PROJECT_NAME": "my-project",
+    })
+    def test_active_flag_follows_state(self):
+        manager = SessionManager(VoiceAgentConfig())
+        assert manager._active is False
+        manager._set_state(SessionState.ACTIVE)
+        assert manager._active is True
+        manager._set_state(SessionState.PROCESSING)
+        assert manager._active is False
+        assert manager.state is SessionState.PROCESSING
+
+
+class _FakeVoiceClient:
+    """Records spoken text; ``sent`` is set on every send_agent_response."""
+
+    def __init__(self):
+        self.spoken = []
+        self.sent = asyncio.Event()
+
+    async def send_agent_response(self, text):
+        self.spoken.append(text)
+        self.sent.set()
+        return f"resp_{len(self.spoken)}"
+
+    async def next_send(self):
+        await asyncio.wait_for(self.sent.wait(), timeout=1)
+        self.sent.clear()
+
+
+class TestTranscriptionHandling:
+    @mock.patch.dict(os.environ, {
+        "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+        "PROJECT_NAME": "my-project",
+    })
+    async def test_agent_turn_does_not_block_event_dispatch(self):
+        manager = SessionManager(VoiceAgentConfig())
+        release = asyncio.Event()
+
+        async def stream_message(thread_id, text):
+            await release.wait()
+            yield "Ihre Bestellung ist unterwegs."
+            yield "Sie kommt morgen an."
+
+        manager._agent_client.stream_message = stream_message
+        voice = manager._voice_client = _FakeVoiceClient()
+
+        # Returns while the agent call is still running
+        await manager._on_transcription_completed({"transcript": "Wo ist meine Bestellung?"})
+        await asyncio.sleep(0)
+        assert len(manager._turn_tasks) == 1
+        assert manager.state is SessionState.PROCESSING
+
+        release.set()
+        await voice.next_send()
+        # The rest of the reply waits until Voice Live has finished the first response
+        assert voice.spoken == ["Ihre Bestellung ist unterwegs."]
+
+        await manager._on_response_done({"type": "response.done"})
+        await asyncio.gather(*manager._turn_tasks)
+        assert voice.spoken == ["Ihre Bestellung ist unterwegs.", "Sie kommt morgen an."]
+        assert manager.state is SessionState.ACTIVE
+        assert manager.context.transcript_history[-1]["text"] == (
+            "Ihre Bestellung ist unterwegs. Sie kommt morgen an."
+        )
+
+    @mock.patch.dict(os.environ, {
+        "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+        "PROJECT_NAME": "my-project",
+    })
+    async def test_rest_of_reply_is_sent_as_one_response(self):
+        manager = SessionManager(VoiceAgentConfig())
+
+        async def stream_message(thread_id, text):
+            yield "Ihre Bestellung ist unterwegs."
+            yield "Sie kommt morgen an."
+            yield "Die Sendungsnummer finden Sie in Ihrer E-Mail."
+
+        manager._agent_client.stream_message = stream_message
+        voice = manager._voice_client = _FakeVoiceClient()
+
+        await manager._on_transcription_completed({"transcript": "Wo ist meine Bestellung?"})
+        await voice.next_send()
+        await manager._on_response_done({"type": "response.done"})
+        await asyncio.gather(*manager._turn_tasks)
+
+        assert voice.spoken == [
+            "Ihre Bestellung ist unterwegs.",
+            "Sie kommt morgen an. Die Sendungsnummer finden Sie in Ihrer E-Mail.",
+        ]
+
+    @mock.patch.dict(os.environ, {
+        "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+        "PROJECT_NAME": "my-project",
+    })
+    async def test_barge_in_drops_the_rest_of_the_reply(self):
+        manager = SessionManager(VoiceAgentConfig())
+
+        async def stream_message(thread_id, text):
+            yield "Ihre Bestellung ist unterwegs."
+            yield "Sie kommt morgen an."
+
+        manager._agent_client.stream_message = stream_message
+        voice = manager._voice_client = _FakeVoiceClient()
+
+        await manager._on_transcription_completed({"transcript": "Wo ist meine Bestellung?"})
+        await voice.next_send()
+        await manager._on_speech_started({"type": "input_audio_buffer.speech_started"})
+        await manager._on_response_done({"type": "response.done"})
+        await asyncio.gather(*manager._turn_tasks)
+
+        assert voice.spoken == ["Ihre Bestellung ist unterwegs."]
+        assert manager.context.transcript_history[-1]["text"] == (
+            "Ihre Bestellung ist unterwegs. Sie kommt morgen an."
+        )
+
+    @mock.patch.dict(os.environ, {
+        "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+        "PROJECT_NAME": "my-project",
+    })
+    async def test_failed_turn_returns_session_to_active(self):
+        manager = SessionManager(VoiceAgentConfig())
+        manager._set_state(SessionState.ACTIVE)
+
+        async def stream_message(thread_id, text):
+            raise RuntimeError("run failed")
+            yield  # pragma: no cover
+
+        manager._agent_client.stream_message = stream_message
+
+        await manager._on_transcription_completed({"transcript": "Hallo?"})
+        await asyncio.gather(*manager._turn_tasks)
+
+        assert manager.state is SessionState.ACTIVE
+
+    @mock.patch.dict(os.environ, {
+        "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+        "PROJECT_NAME": "my-project",
+    })
+    async def test_only_an_error_for_the_pending_response_releases_the_next_sentence(self):
+        manager = SessionManager(VoiceAgentConfig())
+
+        async def stream_message(thread_id, text):
+            yield "Erster Satz."
+            yield "Zweiter Satz."
+
+        manager._agent_client.stream_message = stream_message
+        voice = manager._voice_client = _FakeVoiceClient()
+
+        await manager._on_transcription_completed({"transcript": "Hallo?"})
+        await voice.next_send()
+        await manager._on_error({"error": {"code": "other", "event_id": "evt_9"}})
+        assert not manager._response_idle.is_set()
+        assert voice.spoken == ["Erster Satz."]
+
+        await manager._on_error({"error": {"code": "rejected", "event_id": "resp_1"}})
+        await asyncio.gather(*manager._turn_tasks)
+        assert voice.spoken == ["Erster Satz.", "Zweiter Satz."]
+
+    @mock.patch.dict(os.environ, {
+        "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+        "PROJECT_NAME": "my-project",
+    })
+    async def test_missing_response_done_does_not_hang_the_turn(self, monkeypatch):
+        manager = SessionManager(VoiceAgentConfig())
+        monkeypatch.setattr(SessionManager, "_RESPONSE_IDLE_TIMEOUT_S", 0.01)
+
+        async def stream_message(thread_id, text):
+            yield "Erster Satz."
+            yield "Zweiter Satz."
+
+        manager._agent_client.stream_message = stream_message
+        voice = manager._voice_client = _FakeVoiceClient()
+
+        await manager._on_transcription_completed({"transcript": "Hallo?"})
+        await asyncio.wait_for(asyncio.gather(*manager._turn_tasks), timeout=1)
+
+        assert voice.spoken == ["Erster Satz.", "Zweiter Satz."]
+
+
+class TestSessionStop:
+    @mock.patch.dict(os.environ, {
+        "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+        "PROJECT_NAME": "my-project",
+    })
+    async def test_waits_for_cancelled_turns_before_teardown(self):
+        manager = SessionManager(VoiceAgentConfig())
+        unwound = []
+
+        async def stream_message(thread_id, text):
+            try:
+                await asyncio.Event().wait()
+            finally:
+                await asyncio.sleep(0)
+                unwound.append(True)
+            yield  # pragma: no cover
+
+        async def cleanup():
+            assert unwound == [True]
+
+        manager._agent_client = mock.Mock(stream_message=stream_message, cleanup=cleanup)
+        manager._voice_client = mock.Mock(disconnect=mock.AsyncMock())
+        await manager._on_transcription_completed({"transcript": "Hallo?"})
+        await asyncio.sleep(0)
+
+        await manager.stop()
+
+        assert unwound == [True]
+        assert manager.state is SessionState.DISCONNECTED
+
+
+class TestSessionStart:
+    @mock.patch.dict(os.environ, {
+        "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+        "PROJECT_NAME": "my-project",
+    })
+    async def test_agent_setup_overlaps_voice_live_connect(self):
+        manager = SessionManager(VoiceAgentConfig())
+        connect_started = asyncio.Event()
+
+        async def initialize():
+            # Only completes if connect() is already running alongside it
+            await asyncio.wait_for(connect_started.wait(), timeout=1)
+
+        async def connect():
+            connect_started.set()
+
+        manager._agent_client = mock.Mock(
+            initialize=initialize,
+            create_thread=mock.AsyncMock(return_value="thread_1"),
+        )
+        manager._voice_client = mock.Mock(connect=connect)
+
+        await manager.start()
+
+        assert manager.context.thread_id == "thread_1"
+        assert manager.state is SessionState.ACTIVE
+
+    @mock.patch.dict(os.environ, {
+        "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+        "PROJECT_NAME": "my-project",
+    })
+    async def test_failed_agent_setup_closes_voice_live(self):
+        manager = SessionManager(VoiceAgentConfig())
+        manager._agent_client = mock.Mock(
+            initialize=mock.AsyncMock(side_effect=RuntimeError("agent setup failed")),
+            cleanup=mock.AsyncMock(),
+        )
+        manager._voice_client = mock.Mock(
+            connect=mock.AsyncMock(),
+            disconnect=mock.AsyncMock(),
+        )
+
+        with pytest.raises(RuntimeError, match="agent setup failed"):
+            await manager.start()
+
+        manager._voice_client.disconnect.assert_awaited_once()
+        manager._agent_client.cleanup.assert_awaited_once()
+        assert manager.state is SessionState.DISCONNECTED
@@ -1,7 +1,10 @@
 """Tests for customer service tools."""
 
 from src.tools.crm_tool import identify_customer, get_customer_details
-from src.tools.calendar_tool import check_availability, book_appointment
+from src.tools.calendar_tool import (
+    check_availability,
+    book_appointment,
+)
 from src.tools.order_tool import get_recent_orders, get_order_status
 from src.tools.ticket_tool import create_ticket, get_ticket_status
 
@@ -42,7 +45,7 @@ class TestCalendarTool:
             reason="Beratungsgespräch",
         )
         assert result["success"] is True
-        assert "appointment_id" in result
+        assert result["appointment_id"] == "APT-20250203-1000"
         assert result["customer_id"] == "C-1001"
 
 
@@ -64,6 +67,11 @@ class TestOrderTool:
         result = get_order_status(order_id="ORD-9999")
         assert "error" in result
 
+    def test_returned_order_does_not_mutate_fixture(self):
+        result = get_order_status(order_id="ORD-5001")
+        result["status"] = "cancelled"
+        assert get_order_status(order_id="ORD-5001")["status"] == "in_transit"
+
 
 class TestTicketTool:
     def test_create_ticket(self):
@@ -87,6 +95,17 @@ class TestTicketTool:
         )
         assert result["expected_response_hours"] == 4
 
+    def test_create_ticket_normalizes_unknown_values(self):
+        result = create_ticket(
+            customer_id="C-1001",
+            category="broken_everything",
+            priority="asap",
+            description="Unclear issue.",
+        )
+        assert result["priority"] == "medium"
+        assert result["category"] == "other"
+        assert result["expected_response_hours"] == 48
+
     def test_get_ticket_status(self):
         result = get_ticket_status(ticket_id="TKT-7001")
         assert result["status"] == "open"
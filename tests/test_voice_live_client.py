@@ -0,0 +1,237 @@
+"""Tests for the raw WebSocket Voice Live client."""
+
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import websockets
+
+from src.voice_agent.config import VoiceAgentConfig
+from src.voice_agent import voice_live_client
+from src.voice_agent.voice_live_client import VoiceLiveClient, _extract_audio_delta
+
+_ENV = {
+    "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+    "PROJECT_NAME": "my-project",
+}
+
+
+class _FakeWebSocket:
+    def __init__(self, incoming=()):
+        self.sent = []
+        self.incoming = list(incoming)
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    async def recv(self, decode=None):
+        if not self.incoming:
+            raise websockets.ConnectionClosedOK(None, None)
+        return self.incoming.pop(0)
+
+
+@mock.patch.dict(os.environ, _ENV)
+def _make_client() -> tuple[VoiceLiveClient, _FakeWebSocket]:
+    client = VoiceLiveClient(VoiceAgentConfig())
+    ws = _FakeWebSocket()
+    client._ws = ws
+    return client, ws
+
+
+class TestSendAudio:
+    async def test_send_audio_emits_append_event(self):
+        client, ws = _make_client()
+        chunk = b"\x00\x01" * 600
+
+        await client.send_audio(chunk)
+        await client._send_queued_audio()
+
+        event = json.loads(ws.sent[-1])
+        assert event == {
+            "type": "input_audio_buffer.append",
+            "audio": base64.b64encode(chunk).decode("ascii"),
+        }
+
+    async def test_queued_chunks_are_coalesced(self):
+        client, ws = _make_client()
+        chunks = [bytes([i]) * 2400 for i in range(3)]
+
+        for chunk in chunks:
+            await client.send_audio(chunk)
+        await client._send_queued_audio()
+
+        assert len(ws.sent) == 1
+        assert base64.b64decode(json.loads(ws.sent[0])["audio"]) == b"".join(chunks)
+
+    async def test_coalescing_respects_max_bytes(self):
+        client, ws = _make_client()
+        for i in range(5):
+            await client.send_audio(bytes([i]) * 2400)
+
+        while client._send_queue:
+            await client._send_queued_audio()
+
+        assert len(ws.sent) == 2
+
+    async def test_send_audio_nowait_wakes_writer(self):
+        client, ws = _make_client()
+
+        client.send_audio_nowait(b"\x00" * 2400)
+
+        assert client._send_waker.is_set()
+        assert len(client._send_queue) == 1
+        assert ws.sent == []
+
+    async def test_send_audio_without_connection_raises(self):
+        client, _ = _make_client()
+        client._ws = None
+        with pytest.raises(RuntimeError, match="Not connected"):
+            client.send_audio_nowait(b"\x00" * 2400)
+        assert not client._send_queue
+
+    async def test_writer_error_is_reraised_to_producers(self):
+        client, _ = _make_client()
+
+        class _ClosedWebSocket(_FakeWebSocket):
+            async def send(self, message):
+                raise websockets.ConnectionClosedError(None, None)
+
+        client._ws = _ClosedWebSocket()
+        client._writer_task = asyncio.create_task(client._writer_loop())
+        client.send_audio_nowait(b"\x00" * 2400)
+        await client._writer_task
+
+        with pytest.raises(websockets.ConnectionClosed):
+            client.send_audio_nowait(b"\x00" * 2400)
+        assert not client._send_queue
+
+    async def test_queue_drops_oldest_audio_beyond_limit(self):
+        client, _ = _make_client()
+        chunk_size = 2400
+        for i in range(client._MAX_QUEUED_AUDIO_BYTES // chunk_size + 10):
+            client.send_audio_nowait(bytes([i % 256]) * chunk_size)
+
+        assert client._queued_bytes == client._MAX_QUEUED_AUDIO_BYTES
+        assert client._send_queue[0][0] == 10
+
+    async def test_commit_flushes_queued_audio_first(self):
+        client, ws = _make_client()
+        await client.send_audio(b"\x00" * 2400)
+
+        await client.commit_audio_buffer()
+
+        types = [json.loads(m)["type"] for m in ws.sent]
+        assert types == ["input_audio_buffer.append", "input_audio_buffer.commit"]
+
+    async def test_agent_response_returns_response_create_event_id(self):
+        client, ws = _make_client()
+
+        event_id = await client.send_agent_response("Hallo!")
+
+        assert json.loads(ws.sent[-1]) == {"type": "response.create", "event_id": event_id}
+        assert await client.send_agent_response("Noch da?") != event_id
+
+    async def test_send_without_connection_raises(self):
+        client, _ = _make_client()
+        client._ws = None
+        with pytest.raises(RuntimeError, match="Not connected"):
+            await client.send_text("hello")
+
+
+class TestReceiveLoop:
+    async def test_dispatches_bytes_frames(self):
+        client, _ = _make_client()
+        pcm = b"\x01\x02" * 50
+        ws = _FakeWebSocket([
+            b'{"type":"session.created"}',
+            json.dumps({
+                "type": "response.audio.delta",
+                "delta": base64.b64encode(pcm).decode("ascii"),
+            }, separators=(",", ":")).encode(),
+        ])
+        client._ws = ws
+        client._decode_audio_deltas = True
+        seen = []
+
+        async def handler(event):
+            seen.append(event)
+
+        client.on("session.created", handler)
+        client.on("response.audio.delta", handler)
+        await client._receive_loop()
+        assert seen == [
+            {"type": "session.created"},
+            {"type": "response.audio.delta", "audio": pcm},
+        ]
+
+
+class TestExtractAudioDelta:
+    def test_decodes_audio_delta(self):
+        pcm = b"\x10\x20" * 100
+        message = json.dumps({
+            "type": "response.audio.delta",
+            "response_id": "resp_1",
+            "delta": base64.b64encode(pcm).decode("ascii"),
+        }, separators=(",", ":"))
+        assert _extract_audio_delta(message) == pcm
+
+    def test_decodes_undecoded_bytes_frame(self):
+        pcm = b"\x10\x20" * 100
+        message = json.dumps({
+            "type": "response.audio.delta",
+            "delta": base64.b64encode(pcm).decode("ascii"),
+        }, separators=(",", ":")).encode()
+        assert _extract_audio_delta(message) == pcm
+
+    def test_ignores_other_events(self):
+        message = json.dumps({"type": "response.done"}, separators=(",", ":"))
+        assert _extract_audio_delta(message) is None
+
+
+class TestDispatch:
+    async def test_dispatch_calls_handlers_in_order(self):
+        client, _ = _make_client()
+        calls = []
+
+        async def first(event):
+            calls.append(("first", event["type"]))
+
+        async def second(event):
+            calls.append(("second", event["type"]))
+
+        client.on("response.done", first)
+        client.on_many({"response.done": second})
+
+        await client._dispatch("response.done", {"type": "response.done"})
+        await client._dispatch("session.created", {"type": "session.created"})
+
+        assert calls == [("first", "response.done"), ("second", "response.done")]
+
+
+class TestAuthHeaders:
+    def test_bearer_token_is_cached(self, monkeypatch):
+        credential = mock.Mock()
+        credential.get_token.return_value = SimpleNamespace(
+            token="tok", expires_on=time.time() + 3600
+        )
+        monkeypatch.setattr(voice_live_client, "_credential", credential)
+        monkeypatch.setattr(voice_live_client, "_token_cache", {})
+        monkeypatch.delenv("AZURE_VOICELIVE_API_KEY", raising=False)
+        monkeypatch.delenv("AZURE_API_KEY", raising=False)
+        client, _ = _make_client()
+
+        assert client._auth_headers() == {"Authorization": "Bearer tok"}
+        assert client._auth_headers() == {"Authorization": "Bearer tok"}
+        credential.get_token.assert_called_once()
+
+
+class TestEventLoopRunner:
+    def test_falls_back_to_asyncio_run_without_uvloop(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        assert voice_live_client.event_loop_runner() is asyncio.run
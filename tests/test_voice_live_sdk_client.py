@@ -0,0 +1,53 @@
+"""Tests for the SDK-based Voice Live client."""
+
+import os
+from types import SimpleNamespace
+from unittest import mock
+
+from azure.ai.voicelive.models import ServerEventType
+
+from src.voice_agent.config import VoiceAgentConfig
+from src.voice_agent.voice_live_sdk_client import VoiceLiveSDKClient
+
+_ENV = {
+    "AZURE_FOUNDRY_ENDPOINT": "https://myresource.services.ai.azure.com",
+    "PROJECT_NAME": "my-project",
+}
+
+
+class _FakeConnection:
+    def __init__(self, events):
+        self._events = events
+
+    async def __aiter__(self):
+        for event in self._events:
+            yield event
+
+
+class TestDispatchEvents:
+    @mock.patch.dict(os.environ, _ENV)
+    async def test_routes_enum_and_string_types(self):
+        client = VoiceLiveSDKClient(VoiceAgentConfig())
+        client._connection = _FakeConnection([
+            SimpleNamespace(type=ServerEventType.SESSION_CREATED),
+            SimpleNamespace(type="response.done"),
+            SimpleNamespace(type=ServerEventType.RESPONSE_AUDIO_DELTA),
+        ])
+        seen = []
+
+        async def handler(event):
+            seen.append(str(getattr(event.type, "value", event.type)))
+
+        client.on(ServerEventType.SESSION_CREATED, handler)
+        client.on("response.done", handler)
+        await client.dispatch_events()
+        assert seen == ["session.created", "response.done"]
+
+
+class TestSessionConfig:
+    @mock.patch.dict(os.environ, _ENV)
+    def test_session_config_is_built_once(self):
+        client = VoiceLiveSDKClient(VoiceAgentConfig())
+        session = client._session_config()
+        assert session.voice.name == "de-DE-ConradNeural"
+        assert client._session_config() is session
@@ -19,19 +19,21 @@
 from __future__ import annotations
 
 import asyncio
-import base64
+import binascii
 import inspect
 import json
 import logging
 import os
-import queue
 import signal
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
+from operator import itemgetter
 from pathlib import Path
-from typing import Annotated, Any, Dict, Optional, Union, get_args, get_origin, get_type_hints
+from typing import Annotated, Any, Awaitable, Callable, Dict, Optional, Union, get_args, get_origin
 
 from azure.core.credentials import AzureKeyCredential
 from azure.core.credentials_async import AsyncTokenCredential
@@ -58,6 +60,16 @@ from azure.ai.voicelive.models import (
 from dotenv import load_dotenv
 import pyaudio
 
+try:
+    import orjson  # optional C-backed JSON: pip install orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pybase64  # optional SIMD base64: pip install pybase64
+except ImportError:
+    pybase64 = None
+
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -76,10 +88,9 @@ from src.tools import ALL_TOOLS  # noqa: E402
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 load_dotenv(str(Path(__file__).resolve().parent.parent / ".env"), override=True)
 
-if not os.path.exists("logs"):
-    os.makedirs("logs")
+os.makedirs("logs", exist_ok=True)
 
-timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 log_format = "%(asctime)s:%(name)s:%(levelname)s:%(message)s"
 
@@ -90,11 +101,12 @@ logging.basicConfig(
     level=log_level,
 )
 
-# Also log to console for faster debugging
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter(log_format))
-console_handler.setLevel(log_level)
-logging.getLogger().addHandler(console_handler)
+# Also log to console for faster debugging (LOG_TO_CONSOLE=false to keep only files)
+if os.getenv("LOG_TO_CONSOLE", "true").lower() == "true":
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(log_format))
+    console_handler.setLevel(log_level)
+    logging.getLogger().addHandler(console_handler)
 logger = logging.getLogger(__name__)
 
 
@@ -109,14 +121,16 @@ def python_func_to_voicelive_tool(func) -> FunctionTool:
     Reads type hints like ``Annotated[str, Field(description="...")]`` and
     builds the JSON schema that VoiceLive expects.
     """
-    hints = get_type_hints(func, include_extras=True)
-    sig = inspect.signature(func)
+    # src/tools uses postponed annotations, so they are strings in
+    # func.__annotations__; eval_str resolves them once, keeping Annotated
+    # metadata, without a separate get_type_hints pass.
+    sig = inspect.signature(func, eval_str=True)
 
     properties: Dict[str, Any] = {}
     required: list[str] = []
 
     for param_name, param in sig.parameters.items():
-        hint = hints.get(param_name)
+        hint = param.annotation
         param_schema: Dict[str, Any] = {"type": "string"}
 
         # Extract description from Annotated[str, Field(description=...)]
@@ -150,6 +164,61 @@ def python_func_to_voicelive_tool(func) -> FunctionTool:
 TOOL_DISPATCH: Dict[str, Any] = {func.__name__: func for func in ALL_TOOLS}
 
 
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+def _load_args(arguments: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    return _json_loads(arguments) if isinstance(arguments, str) else arguments
+
+
+def make_tool_invoker(func) -> Callable[[Union[str, Dict[str, Any]]], Any]:
+    """Specialize argument decoding for ``func`` once, at registration time.
+
+    Tools without parameters skip JSON parsing entirely; tools whose
+    parameters are all required are called positionally via ``itemgetter``
+    instead of ``**kwargs``; anything else falls back to keyword expansion.
+    """
+    params = list(inspect.signature(func).parameters.values())
+    if not params:
+        return lambda arguments: func()
+    if all(
+        p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD and p.default is inspect.Parameter.empty
+        for p in params
+    ):
+        if len(params) == 1:
+            name = params[0].name
+            return lambda arguments: func(_load_args(arguments)[name])
+        getter = itemgetter(*(p.name for p in params))
+        return lambda arguments: func(*getter(_load_args(arguments)))
+    return lambda arguments: func(**_load_args(arguments))
+
+
+# Constant "still working" tool output sent before the real result arrives
+IMMEDIATE_ACK_JSON = json.dumps(
+    {"status": "searching", "message": "Abfrage gestartet. Ergebnis folgt in Kuerze."}
+)
+
+# Upper bound on tools executing at the same time
+MAX_CONCURRENT_TOOLS = 4
+
+# Function name -> specialized "decode arguments and call" wrapper
+TOOL_INVOKERS: Dict[str, Callable[[Union[str, Dict[str, Any]]], Any]] = {
+    func.__name__: make_tool_invoker(func) for func in ALL_TOOLS
+}
+
+# Tool schemas are fixed per function, so build them once instead of per session
+VOICE_LIVE_TOOLS: list[Tool] = [python_func_to_voicelive_tool(func) for func in ALL_TOOLS]
+
+
 # ============================================================
 # PENDING QUERY TRACKING
 # ============================================================
@@ -180,15 +249,51 @@ class PendingQuery:
 # ============================================================
 
 
+# Capture callback result, built once instead of per 50 ms chunk
+_CONTINUE = (None, pyaudio.paContinue)
+
+if pybase64 is not None:
+    _b64encode_str = pybase64.b64encode_as_string
+else:
+    def _b64encode_str(data: bytes) -> str:
+        return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+# AUDIO_LATENCY_MS bounds: shorter buffers underrun, longer ones delay barge-in
+_AUDIO_LATENCY_MS_DEFAULT = 50
+_AUDIO_LATENCY_MS_MIN = 10
+_AUDIO_LATENCY_MS_MAX = 200
+
+
+def _audio_latency_ms() -> int:
+    """AUDIO_LATENCY_MS clamped to 10-200ms; the 50ms default if it is not an integer."""
+    raw = os.getenv("AUDIO_LATENCY_MS")
+    if raw is None:
+        return _AUDIO_LATENCY_MS_DEFAULT
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(
+            "Invalid AUDIO_LATENCY_MS=%r, using %sms", raw, _AUDIO_LATENCY_MS_DEFAULT
+        )
+        return _AUDIO_LATENCY_MS_DEFAULT
+    clamped = min(max(value, _AUDIO_LATENCY_MS_MIN), _AUDIO_LATENCY_MS_MAX)
+    if clamped != value:
+        logger.warning("AUDIO_LATENCY_MS=%s out of range, using %sms", value, clamped)
+    return clamped
+
+
 class AudioProcessor:
     """Handles real-time audio capture and playback via PyAudio."""
 
     loop: asyncio.AbstractEventLoop
 
-    class AudioPlaybackPacket:
-        def __init__(self, seq_num: int, data: Optional[bytes]):
-            self.seq_num = seq_num
-            self.data = data
+    # Captured audio sent per append: one WebSocket frame and one loop wakeup
+    # per batch instead of per chunk, well under the VAD silence window
+    CAPTURE_BATCH_MS = 200
+    # Captured audio kept while the sender is stalled; older chunks are dropped
+    # so a slow connection cannot grow the backlog or replay stale speech
+    MAX_CAPTURE_BACKLOG_MS = 5000
 
     def __init__(self, connection):
         self.connection = connection
@@ -196,69 +301,123 @@ class AudioProcessor:
         self.format = pyaudio.paInt16
         self.channels = 1
         self.rate = 24000
-        self.chunk_size = 1200
+        # Frames per PortAudio buffer (50ms by default); lower AUDIO_LATENCY_MS
+        # for snappier barge-in at the cost of more audio callbacks per second
+        latency_ms = _audio_latency_ms()
+        self.chunk_size = self.rate * latency_ms // 1000
+        # Chunks per append and chunks kept in the backlog at this latency
+        self._capture_batch = max(1, self.CAPTURE_BATCH_MS // latency_ms)
         self.input_stream = None
-        self.playback_queue: queue.Queue[AudioProcessor.AudioPlaybackPacket] = (
-            queue.Queue()
-        )
-        self.playback_base = 0
-        self.next_seq_num = 0
+        self._capture_chunks: deque[Optional[bytes]] = deque(
+            maxlen=self.MAX_CAPTURE_BACKLOG_MS // latency_ms
+        )  # None stops the sender
+        self._capture_ready = asyncio.Event()
+        self._capture_wakeup_pending = False
+        self._capture_task: Optional[asyncio.Task] = None
+        # Raw PCM chunks for playback (None ends the stream). deque append/popleft
+        # are thread-safe, so no per-chunk packet object or queue lock is needed.
+        self.playback_queue: deque[Optional[bytes]] = deque()
+        # Bumped by skip_pending_audio so the callback drops its partial chunk
+        self._skip_epoch = 0
+        # Response audio deltas received within one loop tick, queued as one chunk
+        self._delta_accum = bytearray()
+        self._delta_flush_scheduled = False
         self.output_stream: Optional[pyaudio.Stream] = None
 
+    def _capture_callback(self, in_data, _frame_count, _time_info, _status_flags):
+        # Only hand the raw chunk over; encoding and sending happen on the loop
+        chunks = self._capture_chunks
+        chunks.append(in_data)
+        if not self._capture_wakeup_pending and len(chunks) >= self._capture_batch:
+            self._capture_wakeup_pending = True
+            self.loop.call_soon_threadsafe(self._capture_ready.set)
+        return _CONTINUE
+
     def start_capture(self):
         logger.info("Starting microphone capture (rate=%s, chunk=%s)", self.rate, self.chunk_size)
-        def _capture_callback(in_data, _frame_count, _time_info, _status_flags):
-            audio_base64 = base64.b64encode(in_data).decode("utf-8")
-            asyncio.run_coroutine_threadsafe(
-                self.connection.input_audio_buffer.append(audio=audio_base64),
-                self.loop,
-            )
-            return (None, pyaudio.paContinue)
-
         if self.input_stream:
             return
-        self.loop = asyncio.get_event_loop()
+        self.loop = asyncio.get_running_loop()
+        self._capture_task = self.loop.create_task(self._send_captured_audio())
         self.input_stream = self.audio.open(
             format=self.format,
             channels=self.channels,
             rate=self.rate,
             input=True,
             frames_per_buffer=self.chunk_size,
-            stream_callback=_capture_callback,
+            stream_callback=self._capture_callback,
         )
 
+    async def _send_captured_audio(self):
+        """Base64-encode captured chunks in bulk and append them to the input buffer."""
+        chunks = self._capture_chunks
+        batch = self._capture_batch
+        try:
+            while True:
+                await self._capture_ready.wait()
+                self._capture_ready.clear()
+                self._capture_wakeup_pending = False
+                while chunks:
+                    if chunks[0] is None:  # end-of-capture sentinel from shutdown
+                        return
+                    if len(chunks) < batch:
+                        break  # the rest goes out with the next full batch
+                    data = b"".join([chunks.popleft() for _ in range(batch)])
+                    await self.connection.input_audio_buffer.append(audio=_b64encode_str(data))
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Error sending captured audio")
+
     def start_playback(self):
         logger.info("Starting audio playback")
         if self.output_stream:
             return
-        remaining = bytes()
+        # Reused per stream: the callback fills out_buf in place via memoryview
+        # slices instead of concatenating bytes on the audio thread
+        sample_width = pyaudio.get_sample_size(self.format)
+        popleft = self.playback_queue.popleft  # the deque is only ever cleared, never replaced
+        out_buf = bytearray(self.chunk_size * sample_width)
+        out = memoryview(out_buf)
+        silence = bytes(len(out_buf))
+        remaining = memoryview(b"")
+        seen_epoch = self._skip_epoch
 
         def _playback_callback(_in_data, frame_count, _time_info, _status_flags):
-            nonlocal remaining
-            frame_count *= pyaudio.get_sample_size(pyaudio.paInt16)
-            out = remaining[:frame_count]
-            remaining = remaining[frame_count:]
-
-            while len(out) < frame_count:
+            nonlocal out_buf, out, silence, remaining, seen_epoch
+            frame_count *= sample_width
+            if frame_count > len(out_buf):
+                out_buf = bytearray(frame_count)
+                out = memoryview(out_buf)
+                silence = bytes(frame_count)
+
+            if self._skip_epoch != seen_epoch:
+                seen_epoch = self._skip_epoch
+                remaining = memoryview(b"")
+
+            n = min(len(remaining), frame_count)
+            out[:n] = remaining[:n]
+            remaining = remaining[n:]
+
+            while n < frame_count:
                 try:
-                    packet = self.playback_queue.get_nowait()
-                except queue.Empty:
-                    out = out + bytes(frame_count - len(out))
+                    chunk = popleft()
+                except IndexError:
+                    out[n:frame_count] = silence[: frame_count - n]
+                    n = frame_count
                     continue
-                if not packet or not packet.data:
+                if not chunk:
                     break
-                if packet.seq_num < self.playback_base:
-                    if len(remaining) > 0:
-                        remaining = bytes()
-                    continue
-                num_to_take = frame_count - len(out)
-                out = out + packet.data[:num_to_take]
-                remaining = packet.data[num_to_take:]
+                data = memoryview(chunk)
+                num_to_take = min(len(data), frame_count - n)
+                out[n : n + num_to_take] = data[:num_to_take]
+                remaining = data[num_to_take:]
+                n += num_to_take
 
             return (
-                (out, pyaudio.paContinue)
-                if len(out) >= frame_count
-                else (out, pyaudio.paComplete)
+                (bytes(out[:n]), pyaudio.paContinue)
+                if n >= frame_count
+                else (bytes(out[:n]), pyaudio.paComplete)
             )
 
         self.output_stream = self.audio.open(
@@ -270,27 +429,41 @@ class AudioProcessor:
             stream_callback=_playback_callback,
         )
 
-    def _get_and_increase_seq_num(self):
-        seq = self.next_seq_num
-        self.next_seq_num += 1
-        return seq
-
     def queue_audio(self, audio_data: Optional[bytes]) -> None:
-        self.playback_queue.put(
-            AudioProcessor.AudioPlaybackPacket(
-                seq_num=self._get_and_increase_seq_num(), data=audio_data
-            )
-        )
+        self.playback_queue.append(audio_data)
+
+    def queue_audio_delta(self, delta: bytes) -> None:
+        """Buffers a response audio delta; all deltas of one loop tick are queued together."""
+        self._delta_accum += delta
+        if not self._delta_flush_scheduled:
+            self._delta_flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_audio_deltas)
+
+    def _flush_audio_deltas(self) -> None:
+        self._delta_flush_scheduled = False
+        if self._delta_accum:
+            self.playback_queue.append(bytes(self._delta_accum))
+            self._delta_accum.clear()
 
     def skip_pending_audio(self):
         """Stops current audio playback immediately."""
-        self.playback_base = self._get_and_increase_seq_num()
+        self._skip_epoch += 1
+        self._delta_accum.clear()
+        self.playback_queue.clear()
 
-    def shutdown(self):
+    async def shutdown(self):
         if self.input_stream:
             self.input_stream.stop_stream()
             self.input_stream.close()
             self.input_stream = None
+        if self._capture_task:
+            # The stream is closed, so no more chunks can arrive: drop the
+            # unsent ones and wait for the sender to see the sentinel and exit
+            self._capture_chunks.clear()
+            self._capture_chunks.append(None)
+            self._capture_ready.set()
+            await self._capture_task
+            self._capture_task = None
         if self.output_stream:
             self.skip_pending_audio()
             self.queue_audio(None)
@@ -331,6 +504,10 @@ class LocalToolVoiceAssistant:
         self.credential = credential
         self.model = model
         self.voice = voice
+        # Resolved once instead of on every _setup_session call
+        self._voice_config: Union[AzureStandardVoice, str] = (
+            AzureStandardVoice(name=voice) if "-" in voice else voice
+        )
 
         self.instructions = """Du bist ein professioneller Kundenservice-Agent fuer ein deutsches Unternehmen.
 
@@ -355,12 +532,40 @@ Halte Antworten kurz und klar -- sie werden als Sprache vorgelesen."""
         self._active_response = False
         self._response_api_done = False
         self._pending_response_request = False
-        self._resume_after_barge_in = False
 
         self._pending_function_call: Optional[Dict[str, Any]] = None
         self.pending_queries: Dict[str, PendingQuery] = {}
+        # Background tools push themselves here when done; the checker awaits it
+        self._completed_queries: asyncio.Queue[PendingQuery] = asyncio.Queue()
+        # Tools run on their own small pool, capped so a burst of tool calls
+        # cannot exhaust the default executor or starve the audio path
+        self._tool_sem = asyncio.Semaphore(MAX_CONCURRENT_TOOLS)
+        self._tool_executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_TOOLS, thread_name_prefix="tool"
+        )
         self._result_checker_task: Optional[asyncio.Task] = None
 
+        # Event type -> handler, built once so each event costs one dict lookup
+        self._event_handlers: Dict[ServerEventType, Callable[[Any], Awaitable[None]]] = {
+            ServerEventType.SESSION_UPDATED: self._on_session_updated,
+            ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED: self._on_speech_started,
+            ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED: self._on_speech_stopped,
+            ServerEventType.RESPONSE_CREATED: self._on_response_created,
+            ServerEventType.RESPONSE_AUDIO_DELTA: self._on_audio_delta,
+            ServerEventType.RESPONSE_AUDIO_DONE: self._on_audio_done,
+            ServerEventType.RESPONSE_TEXT_DELTA: self._on_text_delta,
+            ServerEventType.RESPONSE_TEXT_DONE: self._on_text_done,
+            ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED: (
+                self._on_transcription_completed
+            ),
+            ServerEventType.RESPONSE_DONE: self._on_response_done,
+            ServerEventType.CONVERSATION_ITEM_CREATED: self._on_item_created,
+            ServerEventType.RESPONSE_FUNCTION_CALL_ARGUMENTS_DONE: (
+                self._on_function_call_arguments_done
+            ),
+            ServerEventType.ERROR: self._on_error,
+        }
+
     async def start(self):
         """Starts the Voice Assistant."""
         try:
@@ -394,18 +599,17 @@ Halte Antworten kurz und klar -- sie werden als Sprache vorgelesen."""
         finally:
             if self._result_checker_task:
                 self._result_checker_task.cancel()
+            for pending in self.pending_queries.values():
+                if pending.task:
+                    pending.task.cancel()
+            self._tool_executor.shutdown(wait=False, cancel_futures=True)
             if self.audio_processor:
-                self.audio_processor.shutdown()
+                await self.audio_processor.shutdown()
 
     async def _setup_session(self):
         """Configures the VoiceLive session with tools from src/tools/."""
 
-        voice_config = (
-            AzureStandardVoice(name=self.voice) if "-" in self.voice else self.voice
-        )
-
-        # Convert all Python tool functions to VoiceLive FunctionTool schemas
-        tools: list[Tool] = [python_func_to_voicelive_tool(func) for func in ALL_TOOLS]
+        tools = VOICE_LIVE_TOOLS
 
         logger.info(
             "Registering %d tools on VoiceLive session: %s",
@@ -416,7 +620,7 @@ Halte Antworten kurz und klar -- sie werden als Sprache vorgelesen."""
         session_config = RequestSession(
             modalities=[Modality.TEXT, Modality.AUDIO],
             instructions=self.instructions,
-            voice=voice_config,
+            voice=self._voice_config,
             input_audio_format=InputAudioFormat.PCM16,
             output_audio_format=OutputAudioFormat.PCM16,
             turn_detection=ServerVad(
@@ -440,112 +644,97 @@ Halte Antworten kurz und klar -- sie werden als Sprache vorgelesen."""
             await self._handle_event(event)
 
     async def _handle_event(self, event):
-        """Event handler with function call support."""
-        logger.debug("Event received: %s", event.type)
-        ap = self.audio_processor
-        conn = self.connection
+        """Event handler with function call support: one dict lookup per event."""
+        event_type = event.type  # SDK models re-deserialize on every attribute read
+        logger.debug("Event received: %s", event_type)
+        handler = self._event_handlers.get(event_type)
+        if handler is not None:
+            await handler(event)
+
+    async def _on_session_updated(self, event):
+        logger.info("Session ready")
+        self.session_ready = True
+        self.audio_processor.start_capture()
+
+    async def _on_speech_started(self, event):
+        print("[Listening...]")
+        self.audio_processor.skip_pending_audio()
+
+        if self._active_response and not self._response_api_done:
+            logger.info("Barge-in detected, canceling active response")
+            try:
+                await self.connection.response.cancel()
+            except Exception:
+                pass
+
+    async def _on_speech_stopped(self, event):
+        print("[Processing...]")
+
+    async def _on_response_created(self, event):
+        self._active_response = True
+        self._response_api_done = False
 
-        if event.type == ServerEventType.SESSION_UPDATED:
-            logger.info("Session ready")
-            self.session_ready = True
-            ap.start_capture()
+    async def _on_audio_delta(self, event):
+        # The SDK base64-decodes on every attribute access, so read it once
+        delta = event.delta
+        if delta:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Audio delta bytes: %d", len(delta))
+            self.audio_processor.queue_audio_delta(delta)
 
-        elif event.type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED:
-            print("[Listening...]")
-            ap.skip_pending_audio()
+    async def _on_audio_done(self, event):
+        print("[Ready...]")
 
-            if self._active_response and not self._response_api_done:
-                logger.info("Barge-in detected, canceling active response")
-                self._resume_after_barge_in = True
-                try:
-                    await conn.response.cancel()
-                except Exception:
-                    pass
+    async def _on_text_delta(self, event):
+        if event.delta:
+            logger.info("Assistant text delta: %s", event.delta)
 
-        elif event.type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED:
-            print("[Processing...]")
-
-        elif event.type == ServerEventType.RESPONSE_CREATED:
-            self._active_response = True
-            self._response_api_done = False
-
-        elif event.type == ServerEventType.RESPONSE_AUDIO_DELTA:
-            if event.delta:
-                logger.debug("Audio delta bytes: %d", len(event.delta))
-            ap.queue_audio(event.delta)
-
-        elif event.type == ServerEventType.RESPONSE_AUDIO_DONE:
-            print("[Ready...]")
-
-        elif event.type == ServerEventType.RESPONSE_TEXT_DELTA:
-            if event.delta:
-                logger.info("Assistant text delta: %s", event.delta)
-
-        elif event.type == ServerEventType.RESPONSE_TEXT_DONE:
-            logger.info("Assistant text done: %s", event.text)
-
-        elif event.type == ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED:
-            logger.info("Transcription: %s", event.transcript)
-
-        elif event.type == ServerEventType.RESPONSE_DONE:
-            self._active_response = False
-            self._response_api_done = True
-
-            if self._pending_response_request:
-                self._pending_response_request = False
-                logger.info("Pending response detected, requesting response now")
-                await conn.response.create()
-
-            if (
-                self._pending_function_call
-                and "arguments" in self._pending_function_call
-            ):
-                await self._handle_function_call(self._pending_function_call)
-                self._pending_function_call = None
-
-        elif event.type == ServerEventType.CONVERSATION_ITEM_CREATED:
-            if event.item.type == ItemType.FUNCTION_CALL:
-                self._pending_function_call = {
-                    "name": event.item.name,
-                    "call_id": event.item.call_id,
-                    "previous_item_id": event.item.id,
-                }
-                print(f"[Tool call: {event.item.name}]")
-
-        elif event.type == ServerEventType.RESPONSE_FUNCTION_CALL_ARGUMENTS_DONE:
-            if (
-                self._pending_function_call
-                and event.call_id == self._pending_function_call["call_id"]
-            ):
-                self._pending_function_call["arguments"] = event.arguments
-                logger.info(
-                    "Function call arguments ready: %s -> %s",
-                    self._pending_function_call["name"],
-                    event.arguments,
-                )
+    async def _on_text_done(self, event):
+        logger.info("Assistant text done: %s", event.text)
 
-        elif event.type == ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED:
-            logger.info("Transcription: %s", event.transcript)
-            # If the user actually said something new, don't replay the old answer.
-            if event.transcript.strip():
-                self._resume_after_barge_in = False
-
-            if self._resume_after_barge_in and not event.transcript.strip():
-                logger.info("Empty transcript after barge-in, requesting response replay")
-                self._resume_after_barge_in = False
-                if not self._active_response:
-                    await conn.response.create()
-                else:
-                    self._pending_response_request = True
-                return
-
-            if not self._active_response:
-                logger.info("Transcription completed, requesting response")
-                await conn.response.create()
-
-        elif event.type == ServerEventType.ERROR:
-            if "no active response" not in event.error.message.lower():
-                logger.error(f"Error: {event.error.message}")
+    async def _on_transcription_completed(self, event):
+        logger.info("Transcription: %s", event.transcript)
+
+    async def _on_response_done(self, event):
+        self._active_response = False
+        self._response_api_done = True
+
+        if self._pending_response_request:
+            self._pending_response_request = False
+            logger.info("Pending response detected, requesting response now")
+            await self.connection.response.create()
+
+        if (
+            self._pending_function_call
+            and "arguments" in self._pending_function_call
+        ):
+            await self._handle_function_call(self._pending_function_call)
+            self._pending_function_call = None
+
+    async def _on_item_created(self, event):
+        if event.item.type == ItemType.FUNCTION_CALL:
+            self._pending_function_call = {
+                "name": event.item.name,
+                "call_id": event.item.call_id,
+                "previous_item_id": event.item.id,
+            }
+            print(f"[Tool call: {event.item.name}]")
+
+    async def _on_function_call_arguments_done(self, event):
+        if (
+            self._pending_function_call
+            and event.call_id == self._pending_function_call["call_id"]
+        ):
+            self._pending_function_call["arguments"] = event.arguments
+            logger.info(
+                "Function call arguments ready: %s -> %s",
+                self._pending_function_call["name"],
+                event.arguments,
+            )
+
+    async def _on_error(self, event):
+        if "no active response" not in event.error.message.lower():
+            logger.error("Error: %s", event.error.message)
 
     # ================================================================
     # FUNCTION CALL HANDLING
@@ -561,22 +750,17 @@ Halte Antworten kurz und klar -- sie werden als Sprache vorgelesen."""
         previous_item_id = function_call_info["previous_item_id"]
         arguments = function_call_info["arguments"]
 
-        logger.info(f"Function call: {function_name}({arguments})")
+        logger.info("Function call: %s(%s)", function_name, arguments)
 
         if function_name not in TOOL_DISPATCH:
-            logger.warning(f"Unknown tool: {function_name}")
+            logger.warning("Unknown tool: %s", function_name)
             return
 
         print(f"[Executing tool in background: {function_name}]")
 
         # 1. Immediate acknowledgement
-        immediate_response = {
-            "status": "searching",
-            "message": "Abfrage gestartet. Ergebnis folgt in Kuerze.",
-        }
-
         function_output = FunctionCallOutputItem(
-            call_id=call_id, output=json.dumps(immediate_response)
+            call_id=call_id, output=IMMEDIATE_ACK_JSON
         )
 
         await self.connection.conversation.item.create(
@@ -608,58 +792,65 @@ Halte Antworten kurz und klar -- sie werden als Sprache vorgelesen."""
     ):
         """Executes a tool function from src/tools/ in the background."""
         try:
-            args = json.loads(arguments) if isinstance(arguments, str) else arguments
-            tool_func = TOOL_DISPATCH[function_name]
+            invoke = TOOL_INVOKERS[function_name]
 
-            logger.info(f"[{query_id}] Calling {function_name}({args})")
+            logger.info("[%s] Calling %s(%s)", query_id, function_name, arguments)
 
-            # Run the tool (use to_thread in case it does blocking I/O)
-            result = await asyncio.to_thread(tool_func, **args)
+            # Decode + run the tool off the loop (it may do blocking I/O)
+            async with self._tool_sem:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._tool_executor, invoke, arguments
+                )
 
-            result_text = json.dumps(result, ensure_ascii=False, default=str)
+            result_text = _json_dumps(result)
 
             self.pending_queries[query_id].result = result_text
-            self.pending_queries[query_id].state = QueryState.COMPLETED
 
-            logger.info(f"[{query_id}] Tool completed: {result_text[:200]}")
+            logger.info("[%s] Tool completed: %.200s", query_id, result_text)
 
         except Exception:
-            logger.exception(f"[{query_id}] Tool execution failed")
-            self.pending_queries[query_id].result = json.dumps(
+            logger.exception("[%s] Tool execution failed", query_id)
+            self.pending_queries[query_id].result = _json_dumps(
                 {"error": "Tool execution failed. Please try again."}
             )
-            self.pending_queries[query_id].state = QueryState.COMPLETED
+
+        pending = self.pending_queries[query_id]
+        pending.state = QueryState.COMPLETED
+        self._completed_queries.put_nowait(pending)
 
     # ================================================================
     # BACKGROUND RESULT CHECKER & INTERRUPT
     # ================================================================
 
     async def _check_for_completed_queries(self):
-        """Polls for completed background queries and injects results."""
+        """Injects each background query result as soon as its tool completes."""
         while True:
-            await asyncio.sleep(0.5)
-
-            for query_id, pending in list(self.pending_queries.items()):
-                if pending.state == QueryState.COMPLETED:
-                    logger.info(f"[{query_id}] Result ready - interrupting")
-                    print(f"\n[RESULT READY: {pending.function_name}]")
+            pending = await self._completed_queries.get()
+            query_id = pending.query_id
 
-                    # 1. Stop audio
-                    self.audio_processor.skip_pending_audio()
+            logger.info("[%s] Result ready - interrupting", query_id)
+            print(f"\n[RESULT READY: {pending.function_name}]")
 
-                    # 2. Cancel active response
-                    if self._active_response and not self._response_api_done:
-                        try:
-                            await self.connection.response.cancel()
-                        except Exception:
-                            pass
+            # 1. Stop audio
+            self.audio_processor.skip_pending_audio()
 
-                    # 3. Send tool result back to VoiceLive
-                    await self._send_tool_result(pending)
+            # 2. Cancel active response
+            if self._active_response and not self._response_api_done:
+                try:
+                    await self.connection.response.cancel()
+                except Exception:
+                    pass
 
-                    # 4. Clean up
-                    pending.state = QueryState.INJECTED
-                    del self.pending_queries[query_id]
+            # 3. Send tool result back to VoiceLive
+            try:
+                await self._send_tool_result(pending)
+                pending.state = QueryState.INJECTED
+            except Exception:
+                # Keep the checker alive for the next result
+                logger.exception("[%s] Failed to send tool result", query_id)
+            finally:
+                # 4. Remove, whether or not the result went through
+                self.pending_queries.pop(query_id, None)
 
     async def _send_tool_result(self, pending: PendingQuery):
         """Send the real tool output back so the model can respond with audio."""
@@ -729,6 +920,12 @@ def main():
         voice=voice,
     )
 
+    try:
+        # Optional libuv-based event loop (pip install uvloop; not on Windows)
+        from uvloop import run
+    except ImportError:
+        run = asyncio.run
+
     def signal_handler(_sig, _frame):
         raise KeyboardInterrupt()
 
@@ -736,7 +933,7 @@ def main():
     signal.signal(signal.SIGTERM, signal_handler)
 
     try:
-        asyncio.run(assistant.start())
+        run(assistant.start())
     except KeyboardInterrupt:
         print("\nGoodbye!")
 
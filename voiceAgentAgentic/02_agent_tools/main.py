@@ -4,20 +4,20 @@
 from __future__ import annotations
 
 import asyncio
-import base64
+import binascii
 import logging
 import os
-import queue
 import signal
 import sys
-from datetime import datetime
-from typing import Optional, Union, TYPE_CHECKING, cast
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional, Union, TYPE_CHECKING, cast
 
 from azure.core.credentials import AzureKeyCredential
 from azure.core.credentials_async import AsyncTokenCredential
 from azure.identity.aio import AzureCliCredential, DefaultAzureCredential
 
-from azure.ai.voicelive.aio import connect
+from azure.ai.voicelive.aio import ConnectionError as VoiceLiveConnectionError, connect
 from azure.ai.voicelive.models import (
     AudioEchoCancellation,
     AudioNoiseReduction,
@@ -34,6 +34,11 @@ from azure.ai.voicelive.models import (
 from dotenv import load_dotenv
 import pyaudio
 
+try:
+    import pybase64  # optional SIMD base64: pip install pybase64
+except ImportError:
+    pybase64 = None
+
 if TYPE_CHECKING:
     from azure.ai.voicelive.aio import VoiceLiveConnection
 
@@ -43,10 +48,9 @@ if TYPE_CHECKING:
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 load_dotenv(str(os.path.join(os.path.dirname(__file__), "..", ".env")), override=True)
 
-if not os.path.exists("logs"):
-    os.makedirs("logs")
+os.makedirs("logs", exist_ok=True)
 
-timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 log_format = "%(asctime)s:%(name)s:%(levelname)s:%(message)s"
 
@@ -64,94 +68,185 @@ error_file_handler.setLevel(logging.ERROR)
 error_file_handler.setFormatter(logging.Formatter(log_format))
 logging.getLogger().addHandler(error_file_handler)
 
-# Also log to console for faster debugging
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter(log_format))
-console_handler.setLevel(log_level)
-logging.getLogger().addHandler(console_handler)
+# Also log to console for faster debugging (LOG_TO_CONSOLE=false to keep only files)
+if os.getenv("LOG_TO_CONSOLE", "true").lower() == "true":
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(log_format))
+    console_handler.setLevel(log_level)
+    logging.getLogger().addHandler(console_handler)
 logger = logging.getLogger(__name__)
 
 
+# Capture callback result, built once instead of per 50 ms chunk
+_CONTINUE = (None, pyaudio.paContinue)
+
+if pybase64 is not None:
+    _b64encode_str = pybase64.b64encode_as_string
+else:
+    def _b64encode_str(data: bytes) -> str:
+        return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+# AUDIO_LATENCY_MS bounds: shorter buffers underrun, longer ones delay barge-in
+_AUDIO_LATENCY_MS_DEFAULT = 50
+_AUDIO_LATENCY_MS_MIN = 10
+_AUDIO_LATENCY_MS_MAX = 200
+
+
+def _audio_latency_ms() -> int:
+    """AUDIO_LATENCY_MS clamped to 10-200ms; the 50ms default if it is not an integer."""
+    raw = os.getenv("AUDIO_LATENCY_MS")
+    if raw is None:
+        return _AUDIO_LATENCY_MS_DEFAULT
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(
+            "Invalid AUDIO_LATENCY_MS=%r, using %sms", raw, _AUDIO_LATENCY_MS_DEFAULT
+        )
+        return _AUDIO_LATENCY_MS_DEFAULT
+    clamped = min(max(value, _AUDIO_LATENCY_MS_MIN), _AUDIO_LATENCY_MS_MAX)
+    if clamped != value:
+        logger.warning("AUDIO_LATENCY_MS=%s out of range, using %sms", value, clamped)
+    return clamped
+
+
 class AudioProcessor:
     """Handles real-time audio capture and playback via PyAudio."""
 
     loop: asyncio.AbstractEventLoop
 
-    class AudioPlaybackPacket:
-        def __init__(self, seq_num: int, data: Optional[bytes]):
-            self.seq_num = seq_num
-            self.data = data
+    # Captured audio sent per append: one WebSocket frame and one loop wakeup
+    # per batch instead of per chunk, well under the VAD silence window
+    CAPTURE_BATCH_MS = 200
+    # Captured audio kept while the sender is stalled; older chunks are dropped
+    # so a slow connection cannot grow the backlog or replay stale speech
+    MAX_CAPTURE_BACKLOG_MS = 5000
 
-    def __init__(self, connection):
+    def __init__(self, connection, audio: Optional[pyaudio.PyAudio] = None):
         self.connection = connection
-        self.audio = pyaudio.PyAudio()
+        # Reuse the caller's PortAudio instance when given (it outlives
+        # reconnects); otherwise own one and terminate it on shutdown
+        self._owns_audio = audio is None
+        self.audio = audio if audio is not None else pyaudio.PyAudio()
         self.format = pyaudio.paInt16
         self.channels = 1
         self.rate = 24000
-        self.chunk_size = 1200  # 50ms
+        # Frames per PortAudio buffer (50ms by default); lower AUDIO_LATENCY_MS
+        # for snappier barge-in at the cost of more audio callbacks per second
+        latency_ms = _audio_latency_ms()
+        self.chunk_size = self.rate * latency_ms // 1000
+        # Chunks per append and chunks kept in the backlog at this latency
+        self._capture_batch = max(1, self.CAPTURE_BATCH_MS // latency_ms)
         self.input_stream = None
-        self.playback_queue: queue.Queue[AudioProcessor.AudioPlaybackPacket] = (
-            queue.Queue()
-        )
-        self.playback_base = 0
-        self.next_seq_num = 0
+        self._capture_chunks: deque[Optional[bytes]] = deque(
+            maxlen=self.MAX_CAPTURE_BACKLOG_MS // latency_ms
+        )  # None stops the sender
+        self._capture_ready = asyncio.Event()
+        self._capture_wakeup_pending = False
+        self._capture_task: Optional[asyncio.Task] = None
+        # Raw PCM chunks for playback (None ends the stream). deque append/popleft
+        # are thread-safe, so no per-chunk packet object or queue lock is needed.
+        self.playback_queue: deque[Optional[bytes]] = deque()
+        # Bumped by skip_pending_audio so the callback drops its partial chunk
+        self._skip_epoch = 0
         self.output_stream: Optional[pyaudio.Stream] = None
 
+    def _capture_callback(self, in_data, _frame_count, _time_info, _status_flags):
+        # Only hand the raw chunk over; encoding and sending happen on the loop
+        chunks = self._capture_chunks
+        chunks.append(in_data)
+        if not self._capture_wakeup_pending and len(chunks) >= self._capture_batch:
+            self._capture_wakeup_pending = True
+            self.loop.call_soon_threadsafe(self._capture_ready.set)
+        return _CONTINUE
+
     def start_capture(self):
         logger.info("Starting microphone capture (rate=%s, chunk=%s)", self.rate, self.chunk_size)
 
-        def _capture_callback(in_data, _frame_count, _time_info, _status_flags):
-            audio_base64 = base64.b64encode(in_data).decode("utf-8")
-            asyncio.run_coroutine_threadsafe(
-                self.connection.input_audio_buffer.append(audio=audio_base64),
-                self.loop,
-            )
-            return (None, pyaudio.paContinue)
-
         if self.input_stream:
             return
-        self.loop = asyncio.get_event_loop()
+        self.loop = asyncio.get_running_loop()
+        self._capture_task = self.loop.create_task(self._send_captured_audio())
         self.input_stream = self.audio.open(
             format=self.format,
             channels=self.channels,
             rate=self.rate,
             input=True,
             frames_per_buffer=self.chunk_size,
-            stream_callback=_capture_callback,
+            stream_callback=self._capture_callback,
         )
 
+    async def _send_captured_audio(self):
+        """Base64-encode captured chunks in bulk and append them to the input buffer."""
+        chunks = self._capture_chunks
+        batch = self._capture_batch
+        try:
+            while True:
+                await self._capture_ready.wait()
+                self._capture_ready.clear()
+                self._capture_wakeup_pending = False
+                while chunks:
+                    if chunks[0] is None:  # end-of-capture sentinel from shutdown
+                        return
+                    if len(chunks) < batch:
+                        break  # the rest goes out with the next full batch
+                    data = b"".join([chunks.popleft() for _ in range(batch)])
+                    await self.connection.input_audio_buffer.append(audio=_b64encode_str(data))
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Error sending captured audio")
+
     def start_playback(self):
         logger.info("Starting audio playback")
         if self.output_stream:
             return
-        remaining = bytes()
+        # Reused per stream: the callback fills out_buf in place via memoryview
+        # slices instead of concatenating bytes on the audio thread
+        sample_width = pyaudio.get_sample_size(self.format)
+        popleft = self.playback_queue.popleft  # the deque is only ever cleared, never replaced
+        out_buf = bytearray(self.chunk_size * sample_width)
+        out = memoryview(out_buf)
+        silence = bytes(len(out_buf))
+        remaining = memoryview(b"")
+        seen_epoch = self._skip_epoch
 
         def _playback_callback(_in_data, frame_count, _time_info, _status_flags):
-            nonlocal remaining
-            frame_count *= pyaudio.get_sample_size(pyaudio.paInt16)
-            out = remaining[:frame_count]
-            remaining = remaining[frame_count:]
-
-            while len(out) < frame_count:
+            nonlocal out_buf, out, silence, remaining, seen_epoch
+            frame_count *= sample_width
+            if frame_count > len(out_buf):
+                out_buf = bytearray(frame_count)
+                out = memoryview(out_buf)
+                silence = bytes(frame_count)
+
+            if self._skip_epoch != seen_epoch:
+                seen_epoch = self._skip_epoch
+                remaining = memoryview(b"")
+
+            n = min(len(remaining), frame_count)
+            out[:n] = remaining[:n]
+            remaining = remaining[n:]
+
+            while n < frame_count:
                 try:
-                    packet = self.playback_queue.get_nowait()
-                except queue.Empty:
-                    out = out + bytes(frame_count - len(out))
+                    chunk = popleft()
+                except IndexError:
+                    out[n:frame_count] = silence[: frame_count - n]
+                    n = frame_count
                     continue
-                if not packet or not packet.data:
+                if not chunk:
                     break
-                if packet.seq_num < self.playback_base:
-                    if len(remaining) > 0:
-                        remaining = bytes()
-                    continue
-                num_to_take = frame_count - len(out)
-                out = out + packet.data[:num_to_take]
-                remaining = packet.data[num_to_take:]
+                data = memoryview(chunk)
+                num_to_take = min(len(data), frame_count - n)
+                out[n : n + num_to_take] = data[:num_to_take]
+                remaining = data[num_to_take:]
+                n += num_to_take
 
             return (
-                (out, pyaudio.paContinue)
-                if len(out) >= frame_count
-                else (out, pyaudio.paComplete)
+                (bytes(out[:n]), pyaudio.paContinue)
+                if n >= frame_count
+                else (bytes(out[:n]), pyaudio.paComplete)
             )
 
         self.output_stream = self.audio.open(
@@ -163,40 +258,46 @@ class AudioProcessor:
             stream_callback=_playback_callback,
         )
 
-    def _get_and_increase_seq_num(self):
-        seq = self.next_seq_num
-        self.next_seq_num += 1
-        return seq
-
     def queue_audio(self, audio_data: Optional[bytes]) -> None:
-        self.playback_queue.put(
-            AudioProcessor.AudioPlaybackPacket(
-                seq_num=self._get_and_increase_seq_num(), data=audio_data
-            )
-        )
+        self.playback_queue.append(audio_data)
 
     def skip_pending_audio(self):
         """Stops current audio playback immediately."""
-        self.playback_base = self._get_and_increase_seq_num()
+        self._skip_epoch += 1
+        self.playback_queue.clear()
 
-    def shutdown(self):
+    async def shutdown(self):
         if self.input_stream:
             self.input_stream.stop_stream()
             self.input_stream.close()
             self.input_stream = None
+        if self._capture_task:
+            # The stream is closed, so no more chunks can arrive: drop the
+            # unsent ones and wait for the sender to see the sentinel and exit
+            self._capture_chunks.clear()
+            self._capture_chunks.append(None)
+            self._capture_ready.set()
+            await self._capture_task
+            self._capture_task = None
         if self.output_stream:
             self.skip_pending_audio()
             self.queue_audio(None)
             self.output_stream.stop_stream()
             self.output_stream.close()
             self.output_stream = None
-        if self.audio:
+        if self.audio and self._owns_audio:
             self.audio.terminate()
 
 
 class AgentVoiceAssistant:
     """VoiceLive + Foundry Agent integration (agent is called by VoiceLive)."""
 
+    # Seconds between WebSocket keep-alive pings
+    HEARTBEAT_INTERVAL = 20.0
+    # Reconnect backoff after a dropped connection, doubling up to the max
+    RECONNECT_INITIAL_DELAY = 1.0
+    RECONNECT_MAX_DELAY = 30.0
+
     def __init__(
         self,
         endpoint: str,
@@ -204,12 +305,18 @@ class AgentVoiceAssistant:
         agent_id: str,
         project_name: str,
         voice: str,
+        audio: Optional[pyaudio.PyAudio] = None,
     ):
         self.endpoint = endpoint
         self.credential = credential
         self.agent_id = agent_id
         self.project_name = project_name
         self.voice = voice
+        # Resolved once instead of on every _setup_session call
+        self._voice_config: Union[AzureStandardVoice, str] = (
+            AzureStandardVoice(name=voice) if "-" in voice else voice
+        )
+        self.audio = audio
         self.connection: Optional["VoiceLiveConnection"] = None
         self.audio_processor: Optional[AudioProcessor] = None
         self.session_ready = False
@@ -217,55 +324,98 @@ class AgentVoiceAssistant:
         self._active_response = False
         self._response_api_done = False
 
+        # Event type -> handler, built once so each event costs one dict lookup
+        self._event_handlers: Dict[ServerEventType, Callable[[Any], Awaitable[None]]] = {
+            ServerEventType.SESSION_UPDATED: self._on_session_updated,
+            ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED: (
+                self._on_transcription_completed
+            ),
+            ServerEventType.RESPONSE_TEXT_DONE: self._on_text_done,
+            ServerEventType.RESPONSE_AUDIO_TRANSCRIPT_DONE: self._on_audio_transcript_done,
+            ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED: self._on_speech_started,
+            ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED: self._on_speech_stopped,
+            ServerEventType.RESPONSE_CREATED: self._on_response_created,
+            ServerEventType.RESPONSE_AUDIO_DELTA: self._on_audio_delta,
+            ServerEventType.RESPONSE_AUDIO_DONE: self._on_audio_done,
+            ServerEventType.RESPONSE_DONE: self._on_response_done,
+            ServerEventType.ERROR: self._on_error,
+        }
+
     async def start(self):
-        """Start the voice assistant session."""
+        """Start the voice assistant session, reconnecting if the connection drops."""
+        # One credential for the whole run, so reconnects reuse its token cache.
+        # With a token credential for VoiceLive (USE_TOKEN_CREDENTIAL) the same
+        # object serves the agent token instead of probing a second chain.
+        owns_agent_cred = isinstance(self.credential, AzureKeyCredential)
+        agent_cred: AsyncTokenCredential = (
+            DefaultAzureCredential() if owns_agent_cred else cast(AsyncTokenCredential, self.credential)
+        )
+        delay = self.RECONNECT_INITIAL_DELAY
         try:
-            logger.info(
-                "Connecting to VoiceLive API with agent %s for project %s",
-                self.agent_id,
-                self.project_name,
-            )
-
-            # Get agent access token for Foundry Agent integration
-            agent_cred = DefaultAzureCredential()
-            agent_access_token = (await agent_cred.get_token("https://ai.azure.com/.default")).token
-            await agent_cred.close()
-            logger.info("Obtained agent access token")
-
-            async with connect(
-                endpoint=self.endpoint,
-                credential=self.credential,
-                query={
-                    "agent-id": self.agent_id,
-                    "agent-project-name": self.project_name,
-                    "agent-access-token": agent_access_token,
-                },
-            ) as connection:
-                self.connection = connection
-                self.audio_processor = AudioProcessor(connection)
-
-                await self._setup_session()
-                self.audio_processor.start_playback()
-
-                print("\n" + "=" * 60)
-                print("STEP 2: VOICE LIVE + FOUNDRY AGENT")
-                print("Speak into your microphone. Press Ctrl+C to exit.")
-                print("=" * 60 + "\n")
-
-                await self._process_events()
+            while True:
+                self.session_ready = False
+                try:
+                    await self._run_connection(agent_cred)
+                except (VoiceLiveConnectionError, OSError):
+                    if not self.conversation_started:
+                        raise  # never connected: configuration problem, not a drop
+                    logger.exception("VoiceLive connection failed")
+                finally:
+                    if self.audio_processor:
+                        await self.audio_processor.shutdown()
+                        self.audio_processor = None
+
+                if self.session_ready:
+                    delay = self.RECONNECT_INITIAL_DELAY
+                logger.warning("VoiceLive connection lost, reconnecting in %.0fs", delay)
+                print(f"[Connection lost - reconnecting in {delay:.0f}s...]")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
         finally:
-            if self.audio_processor:
-                self.audio_processor.shutdown()
+            if owns_agent_cred:
+                await agent_cred.close()
+
+    async def _run_connection(self, agent_cred: AsyncTokenCredential):
+        """Open one VoiceLive connection and process events until it closes."""
+        logger.info(
+            "Connecting to VoiceLive API with agent %s for project %s",
+            self.agent_id,
+            self.project_name,
+        )
+
+        # Get agent access token for Foundry Agent integration
+        agent_access_token = (await agent_cred.get_token("https://ai.azure.com/.default")).token
+        logger.info("Obtained agent access token")
+
+        async with connect(
+            endpoint=self.endpoint,
+            credential=self.credential,
+            query={
+                "agent-id": self.agent_id,
+                "agent-project-name": self.project_name,
+                "agent-access-token": agent_access_token,
+            },
+            # Keep-alive pings stop idle periods from closing the socket
+            connection_options={"heartbeat": self.HEARTBEAT_INTERVAL},
+        ) as connection:
+            self.connection = connection
+            self.audio_processor = AudioProcessor(connection, self.audio)
+
+            await self._setup_session()
+            self.audio_processor.start_playback()
+
+            print("\n" + "=" * 60)
+            print("STEP 2: VOICE LIVE + FOUNDRY AGENT")
+            print("Speak into your microphone. Press Ctrl+C to exit.")
+            print("=" * 60 + "\n")
+
+            await self._process_events()
 
     async def _setup_session(self):
         """Configure VoiceLive session."""
-        voice_config = (
-            AzureStandardVoice(name=self.voice) if "-" in self.voice else self.voice
-        )
-
         session_config = RequestSession(
             modalities=[Modality.TEXT, Modality.AUDIO],
-            voice=voice_config,
+            voice=self._voice_config,
             input_audio_format=InputAudioFormat.PCM16,
             output_audio_format=OutputAudioFormat.PCM16,
             turn_detection=ServerVad(
@@ -291,71 +441,82 @@ class AgentVoiceAssistant:
             await self._handle_event(event)
 
     async def _handle_event(self, event):
-        logger.debug("Event received: %s", event.type)
+        """Dispatches a VoiceLive event: one dict lookup per event."""
+        event_type = event.type  # SDK models re-deserialize on every attribute read
+        logger.debug("Event received: %s", event_type)
+        handler = self._event_handlers.get(event_type)
+        if handler is not None:
+            await handler(event)
+
+    async def _on_session_updated(self, event):
         ap = self.audio_processor
         conn = self.connection
         assert ap is not None
         assert conn is not None
+        logger.info("Session ready")
+        self.session_ready = True
+        if not self.conversation_started:
+            self.conversation_started = True
+            try:
+                await conn.response.create()
+            except Exception:
+                logger.exception("Failed to send proactive greeting")
+        ap.start_capture()
+
+    async def _on_transcription_completed(self, event):
+        transcript = event.get("transcript", "")
+        print(f"[You said] {transcript}")
+
+    async def _on_text_done(self, event):
+        text = event.get("text", "")
+        print(f"[Agent] {text}")
+
+    async def _on_audio_transcript_done(self, event):
+        transcript = event.get("transcript", "")
+        print(f"[Agent audio transcript] {transcript}")
+
+    async def _on_speech_started(self, event):
+        ap = self.audio_processor
+        conn = self.connection
+        assert ap is not None
+        assert conn is not None
+        print("[Listening...]")
+        ap.skip_pending_audio()
+        if self._active_response and not self._response_api_done:
+            try:
+                await conn.response.cancel()
+            except Exception:
+                pass
+
+    async def _on_speech_stopped(self, event):
+        print("[Processing...]")
+
+    async def _on_response_created(self, event):
+        self._active_response = True
+        self._response_api_done = False
 
-        if event.type == ServerEventType.SESSION_UPDATED:
-            logger.info("Session ready")
-            self.session_ready = True
-            if not self.conversation_started:
-                self.conversation_started = True
-                try:
-                    await conn.response.create()
-                except Exception:
-                    logger.exception("Failed to send proactive greeting")
-            ap.start_capture()
-
-        elif event.type == ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED:
-            transcript = event.get("transcript", "")
-            print(f"[You said] {transcript}")
-
-        elif event.type == ServerEventType.RESPONSE_TEXT_DONE:
-            text = event.get("text", "")
-            print(f"[Agent] {text}")
-
-        elif event.type == ServerEventType.RESPONSE_AUDIO_TRANSCRIPT_DONE:
-            transcript = event.get("transcript", "")
-            print(f"[Agent audio transcript] {transcript}")
-
-        elif event.type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED:
-            print("[Listening...]")
-            ap.skip_pending_audio()
-            if self._active_response and not self._response_api_done:
-                try:
-                    await conn.response.cancel()
-                except Exception:
-                    pass
-
-        elif event.type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED:
-            print("[Processing...]")
-
-        elif event.type == ServerEventType.RESPONSE_CREATED:
-            self._active_response = True
-            self._response_api_done = False
-
-        elif event.type == ServerEventType.RESPONSE_AUDIO_DELTA:
-            ap.queue_audio(event.delta)
+    async def _on_audio_delta(self, event):
+        ap = self.audio_processor
+        assert ap is not None
+        ap.queue_audio(event.delta)
 
-        elif event.type == ServerEventType.RESPONSE_AUDIO_DONE:
-            print("[Ready...]")
+    async def _on_audio_done(self, event):
+        print("[Ready...]")
 
-        elif event.type == ServerEventType.RESPONSE_DONE:
-            self._active_response = False
-            self._response_api_done = True
+    async def _on_response_done(self, event):
+        self._active_response = False
+        self._response_api_done = True
 
-        elif event.type == ServerEventType.ERROR:
-            msg = event.error.message
-            if "no active response" in msg.lower():
-                logger.debug("Benign cancel error: %s", msg)
-            else:
-                logger.error("VoiceLive error: %s", msg)
-                print(f"Error: {msg}")
+    async def _on_error(self, event):
+        msg = event.error.message
+        if "no active response" in msg.lower():
+            logger.debug("Benign cancel error: %s", msg)
+        else:
+            logger.error("VoiceLive error: %s", msg)
+            print(f"Error: {msg}")
 
 
-def main():
+def main(audio: Optional[pyaudio.PyAudio] = None):
     voicelive_endpoint = os.environ.get("AZURE_VOICELIVE_ENDPOINT")
     voicelive_api_key = os.environ.get("AZURE_VOICELIVE_API_KEY")
     voice = os.environ.get("AZURE_VOICELIVE_VOICE", "de-DE-ConradNeural")
@@ -392,8 +553,15 @@ def main():
         agent_id=agent_id,
         project_name=project_name,
         voice=voice,
+        audio=audio,
     )
 
+    try:
+        # Optional libuv-based event loop (pip install uvloop; not on Windows)
+        from uvloop import run
+    except ImportError:
+        run = asyncio.run
+
     def signal_handler(_sig, _frame):
         raise KeyboardInterrupt()
 
@@ -401,7 +569,7 @@ def main():
     signal.signal(signal.SIGTERM, signal_handler)
 
     try:
-        asyncio.run(assistant.start())
+        run(assistant.start())
     except KeyboardInterrupt:
         print("\nGoodbye!")
 
@@ -419,8 +587,6 @@ if __name__ == "__main__":
             for i in range(p.get_device_count())
             if cast(Union[int, float], p.get_device_info_by_index(i).get("maxOutputChannels", 0) or 0) > 0
         ]
-        p.terminate()
-
         if not input_devices:
             print("❌ No audio input devices found. Please check your microphone.")
             sys.exit(1)
@@ -434,4 +600,8 @@ if __name__ == "__main__":
 
     print("🎙️  VoiceLive + Foundry Agent")
     print("=" * 50)
-    main()
+    try:
+        # One PortAudio instance for the device check and every session
+        main(p)
+    finally:
+        p.terminate()